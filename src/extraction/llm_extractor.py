@@ -1,18 +1,26 @@
 """LLM-based field extraction using Ollama (primary) and Gemini (fallback)."""
 
-import json
+import asyncio
+import hashlib
 import re
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Any
 
+import msgspec
 import ollama
 import google.generativeai as genai
 
 from ..config import get_settings
 
+# Matches the outermost JSON object in a free-form LLM response
+_JSON_RE = re.compile(r'\{[\s\S]*\}')
 
-@dataclass
+
+@dataclass(slots=True)
 class ExtractedField:
     """A single extracted field with confidence."""
     
@@ -22,7 +30,7 @@ class ExtractedField:
     source_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Result from LLM extraction."""
     
@@ -34,6 +42,62 @@ class ExtractionResult:
     error: str = ""
 
 
+class _FieldPayload(msgspec.Struct):
+    """Wire format of a single field in the LLM JSON response."""
+    
+    value: Any = None
+    confidence: float = 0.5
+    source_text: str | None = ""
+
+
+class _ExtractionPayload(msgspec.Struct):
+    """Wire format of the LLM JSON response."""
+    
+    document_type: str | None = None
+    fields: dict[str, _FieldPayload] = {}
+
+
+# strict=False lets numeric strings like "0.95" decode into float confidences
+_DECODER = msgspec.json.Decoder(_ExtractionPayload, strict=False)
+
+
+def _parse_confidence(value: Any) -> float:
+    """Read a field's confidence, defaulting to 0.5 if it isn't a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.5
+
+
+def _decode_payload(raw: str) -> _ExtractionPayload:
+    """Decode an LLM JSON response, tolerating fields given as bare values.
+    
+    Raises:
+        msgspec.DecodeError: If ``raw`` is not a JSON object.
+    """
+    try:
+        return _DECODER.decode(raw)
+    except msgspec.ValidationError:
+        # Valid JSON in a looser shape, e.g. {"fields": {"name": "John"}}
+        data = msgspec.json.decode(raw)
+        if not isinstance(data, dict):
+            raise
+    
+    fields = {}
+    for field_name, field_data in data.get("fields", {}).items():
+        if isinstance(field_data, dict):
+            fields[field_name] = _FieldPayload(
+                value=field_data.get("value"),
+                confidence=_parse_confidence(field_data.get("confidence", 0.5)),
+                source_text=field_data.get("source_text", ""),
+            )
+        else:
+            # Simple value without metadata
+            fields[field_name] = _FieldPayload(value=field_data)
+    
+    return _ExtractionPayload(document_type=data.get("document_type"), fields=fields)
+
+
 # Prompt template for field extraction
 EXTRACTION_PROMPT = """You are an expert document analyst specializing in Indian identity documents and official records.
 Extract structured information from the following document text.
@@ -78,11 +142,55 @@ Return ONLY valid JSON in this exact format:
 Return ONLY the JSON, no explanations or other text.
 """
 
+# Everything around {text} depends only on the document schema, so it is
+# rendered once per schema and requests share an identical prompt prefix
+# (which also lets Ollama reuse the prefix's KV cache across a batch)
+_PROMPT_PREFIX_TMPL, _PROMPT_SUFFIX_TMPL = EXTRACTION_PROMPT.split("{text}")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tokenizer used for prompt budgeting, or None if unavailable."""
+    try:
+        import tiktoken
+        
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # tiktoken missing or its BPE file could not be fetched
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Trim text to at most ``max_tokens`` tokens."""
+    # Every token covers at least one UTF-8 byte, so short texts always fit
+    if len(text) * 4 <= max_tokens:
+        return text
+    
+    encoding = _get_encoding()
+    if encoding is None:
+        # Rough fallback at ~4 characters per token
+        return text[:max_tokens * 4]
+    
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+@lru_cache(maxsize=32)
+def _prompt_parts(document_type: str, field_names: tuple[str, ...]) -> tuple[str, str]:
+    """Render the prompt text before and after the document text."""
+    values = {"document_type": document_type, "field_names": ", ".join(field_names)}
+    return _PROMPT_PREFIX_TMPL.format(**values), _PROMPT_SUFFIX_TMPL.format(**values)
+
 
 
 class LLMExtractor(ABC):
     """Abstract base for LLM extractors."""
     
+    # Token budget for document text within the model's context window
+    max_text_tokens: int = 3500
+    
     @abstractmethod
     def extract(
         self, 
@@ -93,47 +201,68 @@ class LLMExtractor(ABC):
         """Extract fields from text using LLM."""
         pass
     
+    async def aextract(
+        self,
+        text: str,
+        document_type: str,
+        expected_fields: list[str],
+    ) -> ExtractionResult:
+        """Extract fields from text without blocking the event loop.
+        
+        The default implementation runs the blocking ``extract`` in a worker
+        thread; subclasses with a native async client should override it.
+        """
+        return await asyncio.to_thread(self.extract, text, document_type, expected_fields)
+    
+    async def extract_many(
+        self,
+        texts: list[str],
+        document_type: str,
+        expected_fields: list[str],
+    ) -> list[ExtractionResult]:
+        """Extract fields from several texts concurrently.
+        
+        Args:
+            texts: Document texts to analyze.
+            document_type: Type of document shared by all texts.
+            expected_fields: List of field names to extract.
+            
+        Returns:
+            One ExtractionResult per input text, in the same order.
+        """
+        return list(await asyncio.gather(*[
+            self.aextract(text, document_type, expected_fields) for text in texts
+        ]))
+    
+    def _build_prompt(
+        self,
+        text: str,
+        document_type: str,
+        expected_fields: list[str],
+    ) -> str:
+        """Build the extraction prompt for a single document."""
+        prefix, suffix = _prompt_parts(document_type, tuple(expected_fields))
+        return prefix + _truncate_tokens(text, self.max_text_tokens) + suffix
+    
     def _parse_response(self, response: str, document_type: str) -> ExtractionResult:
         """Parse LLM JSON response into ExtractionResult."""
         try:
-            # Try to extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if not json_match:
-                return ExtractionResult(
-                    document_type=document_type,
-                    fields={},
-                    raw_response=response,
-                    success=False,
-                    error="No JSON found in response",
-                )
-            
-            data = json.loads(json_match.group())
-            
-            fields = {}
-            for field_name, field_data in data.get("fields", {}).items():
-                if isinstance(field_data, dict):
-                    fields[field_name] = ExtractedField(
-                        name=field_name,
-                        value=field_data.get("value"),
-                        confidence=float(field_data.get("confidence", 0.5)),
-                        source_text=field_data.get("source_text", ""),
+            try:
+                # Fast path: model returned pure JSON (Ollama format="json")
+                payload = _decode_payload(response)
+            except msgspec.DecodeError:
+                # Try to extract JSON embedded in surrounding text
+                json_match = _JSON_RE.search(response)
+                if not json_match:
+                    return ExtractionResult(
+                        document_type=document_type,
+                        fields={},
+                        raw_response=response,
+                        success=False,
+                        error="No JSON found in response",
                     )
-                else:
-                    # Simple value without metadata
-                    fields[field_name] = ExtractedField(
-                        name=field_name,
-                        value=field_data,
-                        confidence=0.5,
-                    )
-            
-            return ExtractionResult(
-                document_type=data.get("document_type", document_type),
-                fields=fields,
-                raw_response=response,
-                success=True,
-            )
-            
-        except json.JSONDecodeError as e:
+                payload = _decode_payload(json_match.group())
+        except msgspec.DecodeError as e:
             return ExtractionResult(
                 document_type=document_type,
                 fields={},
@@ -141,6 +270,23 @@ class LLMExtractor(ABC):
                 success=False,
                 error=f"JSON parse error: {str(e)}",
             )
+        
+        fields = {
+            field_name: ExtractedField(
+                name=field_name,
+                value=field_data.value,
+                confidence=field_data.confidence,
+                source_text=field_data.source_text or "",
+            )
+            for field_name, field_data in payload.fields.items()
+        }
+        
+        return ExtractionResult(
+            document_type=payload.document_type or document_type,
+            fields=fields,
+            raw_response=response,
+            success=True,
+        )
 
 
 class OllamaExtractor(LLMExtractor):
@@ -161,8 +307,20 @@ class OllamaExtractor(LLMExtractor):
         self.model = model or settings.ollama_model
         self.host = host or settings.ollama_host
         
-        # Configure Ollama client
+        # Configure Ollama clients (sync for single docs, async for batches)
         self.client = ollama.Client(host=self.host)
+        self.aclient = ollama.AsyncClient(host=self.host)
+        self.max_concurrency = settings.ollama_num_parallel
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the in-flight request limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+            self._semaphore_loop = loop
+        return self._semaphore
     
     def extract(
         self,
@@ -180,16 +338,13 @@ class OllamaExtractor(LLMExtractor):
         Returns:
             ExtractionResult with extracted fields.
         """
-        prompt = EXTRACTION_PROMPT.format(
-            document_type=document_type,
-            field_names=", ".join(expected_fields),
-            text=text[:8000],  # Limit text length for context
-        )
+        prompt = self._build_prompt(text, document_type, expected_fields)
         
         try:
             response = self.client.chat(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
+                format="json",
                 options={"temperature": 0.1},  # Low temp for consistent output
             )
             
@@ -206,11 +361,58 @@ class OllamaExtractor(LLMExtractor):
                 error=f"Ollama error: {str(e)}",
                 model_used=f"ollama/{self.model}",
             )
+    
+    async def aextract(
+        self,
+        text: str,
+        document_type: str,
+        expected_fields: list[str],
+    ) -> ExtractionResult:
+        """Extract fields using the async Ollama client.
+        
+        Concurrent calls reach the server together so it can batch them
+        (see ``OLLAMA_NUM_PARALLEL``); in-flight requests are capped at
+        ``max_concurrency`` to avoid queueing beyond the server's slots.
+        
+        Args:
+            text: Document text to analyze.
+            document_type: Type of document (transcript, id, certificate).
+            expected_fields: List of field names to extract.
+            
+        Returns:
+            ExtractionResult with extracted fields.
+        """
+        prompt = self._build_prompt(text, document_type, expected_fields)
+        
+        try:
+            async with self._get_semaphore():
+                response = await self.aclient.chat(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    format="json",
+                    options={"temperature": 0.1},
+                )
+            
+            response_text = response["message"]["content"]
+            result = self._parse_response(response_text, document_type)
+            result.model_used = f"ollama/{self.model}"
+            return result
+            
+        except Exception as e:
+            return ExtractionResult(
+                document_type=document_type,
+                fields={},
+                success=False,
+                error=f"Ollama error: {str(e)}",
+                model_used=f"ollama/{self.model}",
+            )
 
 
 class GeminiExtractor(LLMExtractor):
     """Google Gemini API extractor for fallback."""
     
+    max_text_tokens = 25000  # Gemini has larger context
+    
     def __init__(self, api_key: str = None, model: str = "gemini-1.5-flash"):
         """Initialize Gemini extractor.
         
@@ -227,6 +429,10 @@ class GeminiExtractor(LLMExtractor):
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(model)
         self.model_name = model
+        self.generation_config = genai.GenerationConfig(
+            temperature=0.1,
+            max_output_tokens=2048,
+        )
     
     def extract(
         self,
@@ -244,19 +450,50 @@ class GeminiExtractor(LLMExtractor):
         Returns:
             ExtractionResult with extracted fields.
         """
-        prompt = EXTRACTION_PROMPT.format(
-            document_type=document_type,
-            field_names=", ".join(expected_fields),
-            text=text[:30000],  # Gemini has larger context
-        )
+        prompt = self._build_prompt(text, document_type, expected_fields)
         
         try:
             response = self.model.generate_content(
                 prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=0.1,
-                    max_output_tokens=2048,
-                ),
+                generation_config=self.generation_config,
+            )
+            
+            response_text = response.text
+            result = self._parse_response(response_text, document_type)
+            result.model_used = f"gemini/{self.model_name}"
+            return result
+            
+        except Exception as e:
+            return ExtractionResult(
+                document_type=document_type,
+                fields={},
+                success=False,
+                error=f"Gemini error: {str(e)}",
+                model_used=f"gemini/{self.model_name}",
+            )
+    
+    async def aextract(
+        self,
+        text: str,
+        document_type: str,
+        expected_fields: list[str],
+    ) -> ExtractionResult:
+        """Extract fields using Gemini's async API.
+        
+        Args:
+            text: Document text to analyze.
+            document_type: Type of document.
+            expected_fields: List of field names to extract.
+            
+        Returns:
+            ExtractionResult with extracted fields.
+        """
+        prompt = self._build_prompt(text, document_type, expected_fields)
+        
+        try:
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=self.generation_config,
             )
             
             response_text = response.text
@@ -283,6 +520,7 @@ class LLMPipeline:
         fallback: LLMExtractor = None,
         use_fallback_on_low_confidence: bool = True,
         confidence_threshold: float = 0.7,
+        cache_size: int = 4096,
     ):
         """Initialize LLM pipeline.
         
@@ -291,14 +529,21 @@ class LLMPipeline:
             fallback: Fallback extractor (default: Gemini).
             use_fallback_on_low_confidence: Whether to try fallback on low confidence.
             confidence_threshold: Minimum average confidence before fallback.
+            cache_size: Number of successful results kept in the in-process
+                response cache (0 disables caching).
         """
         self.primary = primary
         self.fallback = fallback
         self.use_fallback_on_low_confidence = use_fallback_on_low_confidence
         self.confidence_threshold = confidence_threshold
+        self.cache_size = cache_size
         
         self._primary_initialized = False
         self._fallback_initialized = False
+        
+        # LRU cache of content hash -> ExtractionResult
+        self._cache: OrderedDict[str, ExtractionResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def _ensure_primary(self):
         """Lazy initialize primary extractor."""
@@ -318,6 +563,40 @@ class LLMPipeline:
                     self.fallback = None
             self._fallback_initialized = True
     
+    def _cache_key(
+        self,
+        text: str,
+        document_type: str,
+        expected_fields: list[str],
+    ) -> str:
+        """Content hash identifying an extraction request."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(document_type.encode())
+        digest.update(b"\0")
+        digest.update("|".join(expected_fields).encode())
+        digest.update(b"\0")
+        digest.update(text.encode())
+        return digest.hexdigest()
+    
+    def _cache_get(self, key: str) -> ExtractionResult | None:
+        """Look up a cached result, returning a copy the caller may mutate."""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+        return replace(result, fields=dict(result.fields))
+    
+    def _cache_put(self, key: str, result: ExtractionResult) -> None:
+        """Store a successful result, evicting the least recently used."""
+        if not self.cache_size or not result.success:
+            return
+        with self._cache_lock:
+            self._cache[key] = replace(result, fields=dict(result.fields))
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
     def extract(
         self,
         text: str,
@@ -326,6 +605,9 @@ class LLMPipeline:
     ) -> ExtractionResult:
         """Extract fields using LLM pipeline.
         
+        Identical requests (same text, document type and fields) are served
+        from an in-process LRU cache instead of calling the LLM again.
+        
         Args:
             text: Document text.
             document_type: Type of document.
@@ -334,6 +616,22 @@ class LLMPipeline:
         Returns:
             Best ExtractionResult from available engines.
         """
+        key = self._cache_key(text, document_type, expected_fields)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._extract_uncached(text, document_type, expected_fields)
+        self._cache_put(key, result)
+        return result
+    
+    def _extract_uncached(
+        self,
+        text: str,
+        document_type: str,
+        expected_fields: list[str],
+    ) -> ExtractionResult:
+        """Run the primary/fallback extraction for a single document."""
         # Try primary (Ollama)
         self._ensure_primary()
         try:
@@ -379,6 +677,109 @@ class LLMPipeline:
                 error=f"All extractors failed: {str(e)}",
             )
     
+    async def extract_many(
+        self,
+        texts: list[str],
+        document_type: str,
+        expected_fields: list[str],
+    ) -> list[ExtractionResult]:
+        """Extract fields from several texts of one document type.
+        
+        Args:
+            texts: Document texts.
+            document_type: Type of document shared by all texts.
+            expected_fields: Expected field names.
+            
+        Returns:
+            Best ExtractionResult per input text, in the same order.
+        """
+        return await self.extract_batch(
+            [(text, document_type, expected_fields) for text in texts]
+        )
+    
+    async def extract_batch(
+        self,
+        items: list[tuple[str, str, list[str]]],
+    ) -> list[ExtractionResult]:
+        """Extract fields from a batch of documents using the LLM pipeline.
+        
+        All items go to the primary engine concurrently; only the items that
+        failed or came back below the confidence threshold are re-issued,
+        again concurrently, to the fallback engine.
+        
+        Items already in the response cache are not sent to either engine.
+        
+        Args:
+            items: ``(text, document_type, expected_fields)`` per document.
+            
+        Returns:
+            Best ExtractionResult per item, in the same order.
+        """
+        keys = [self._cache_key(*item) for item in items]
+        results: list[ExtractionResult | None] = [self._cache_get(key) for key in keys]
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            fresh = await self._extract_batch_uncached([items[i] for i in pending])
+            for i, result in zip(pending, fresh):
+                results[i] = result
+                self._cache_put(keys[i], result)
+        
+        return results
+    
+    async def _extract_batch_uncached(
+        self,
+        items: list[tuple[str, str, list[str]]],
+    ) -> list[ExtractionResult]:
+        """Run the two-phase primary/fallback extraction for a batch."""
+        self._ensure_primary()
+        results = list(await asyncio.gather(
+            *[self.primary.aextract(*item) for item in items],
+            return_exceptions=True,
+        ))
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                results[i] = ExtractionResult(
+                    document_type=items[i][1],
+                    fields={},
+                    success=False,
+                    error=f"All extractors failed: {str(result)}",
+                )
+        
+        retry_indices = [
+            i for i, result in enumerate(results)
+            if not result.success
+            or (
+                self.use_fallback_on_low_confidence
+                and self._average_confidence(result) < self.confidence_threshold
+            )
+        ]
+        if not retry_indices:
+            return results
+        
+        self._ensure_fallback()
+        if not self.fallback:
+            return results
+        
+        fallback_results = await asyncio.gather(
+            *[self.fallback.aextract(*items[i]) for i in retry_indices],
+            return_exceptions=True,
+        )
+        for i, fallback_result in zip(retry_indices, fallback_results):
+            if isinstance(fallback_result, Exception):
+                continue
+            
+            # Keep whichever result has the higher confidence
+            result = results[i]
+            if not result.success:
+                results[i] = fallback_result
+            elif fallback_result.success and (
+                self._average_confidence(fallback_result) > self._average_confidence(result)
+            ):
+                results[i] = fallback_result
+        
+        return results
+    
     def _average_confidence(self, result: ExtractionResult) -> float:
         """Calculate average confidence across all fields."""
         if not result.fields:
@@ -1,13 +1,16 @@
 """OCR engine abstraction with EasyOCR and Tesseract fallback."""
 
+import threading
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Protocol, runtime_checkable
 
 import numpy as np
 from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRWord:
     """A single detected word with position and confidence."""
     
@@ -16,7 +19,7 @@ class OCRWord:
     bbox: tuple[int, int, int, int]  # x1, y1, x2, y2
     
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Result from OCR processing."""
     
@@ -36,20 +39,75 @@ class OCREngine(Protocol):
         ...
 
 
+@lru_cache(maxsize=4)
+def _get_easyocr_reader(languages: tuple[str, ...], gpu: bool, quantize: bool):
+    """Get a shared EasyOCR reader, loading model weights once per process."""
+    import easyocr
+    
+    # cudnn_benchmark auto-tunes convolution algorithms for the page sizes seen
+    return easyocr.Reader(
+        list(languages), gpu=gpu, quantize=quantize, cudnn_benchmark=gpu
+    )
+
+
+def _cuda_available() -> bool:
+    """Check whether a CUDA device can be used for OCR inference."""
+    try:
+        import torch
+        
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+def _auto_batch_size(gpu: bool, default: int = 8) -> int:
+    """Pick an EasyOCR recognizer batch size from free GPU memory."""
+    if not gpu:
+        return default
+    try:
+        import torch
+        
+        free_bytes, _ = torch.cuda.mem_get_info()
+    except Exception:
+        return default
+    
+    # Budget a conservative 256MB of activations per batched crop
+    return max(1, min(64, free_bytes // (256 * 1024 * 1024)))
+
+
 class EasyOCREngine:
     """EasyOCR-based text recognition."""
     
-    def __init__(self, languages: list[str] = None, gpu: bool = False):
+    def __init__(
+        self,
+        languages: list[str] = None,
+        gpu: bool | None = None,
+        batch_size: int | None = None,
+        quantize: bool = True,
+    ):
         """Initialize EasyOCR reader.
         
         Args:
             languages: List of language codes (e.g., ['en', 'hi']).
-            gpu: Whether to use GPU acceleration.
+            gpu: Whether to use GPU acceleration (default: when CUDA is
+                available). On GPU, inference runs under FP16 autocast.
+            batch_size: Recognizer batch size for ``recognize_batch``
+                (default: sized from free GPU memory).
+            quantize: Run the detector and recognizer with int8 dynamic
+                quantization when on CPU.
         """
-        import easyocr
-        
         self.languages = languages or ["en"]
-        self.reader = easyocr.Reader(self.languages, gpu=gpu)
+        self.gpu = _cuda_available() if gpu is None else gpu
+        self.reader = _get_easyocr_reader(tuple(self.languages), self.gpu, quantize)
+        self.batch_size = batch_size or _auto_batch_size(self.gpu)
+    
+    def _inference_context(self):
+        """Mixed-precision context for reader calls (FP16 on GPU)."""
+        if not self.gpu:
+            return nullcontext()
+        import torch
+        
+        return torch.autocast("cuda", dtype=torch.float16)
     
     def recognize(self, image: Image.Image) -> OCRResult:
         """Perform OCR using EasyOCR.
@@ -60,32 +118,78 @@ class EasyOCREngine:
         Returns:
             OCRResult with extracted text.
         """
-        # Convert PIL to numpy array
-        img_array = np.array(image)
+        # Convert PIL to numpy array (read-only view, no extra copy)
+        img_array = np.asarray(image)
         
         # Run EasyOCR
-        results = self.reader.readtext(img_array)
+        with self._inference_context():
+            results = self.reader.readtext(img_array)
         
-        words = []
-        total_confidence = 0
+        return self._build_result(results)
+    
+    def recognize_batch(self, images: list[Image.Image]) -> list[OCRResult]:
+        """Perform OCR on several images with batched EasyOCR inference.
+        
+        ``readtext_batched`` needs equally sized inputs, so images are grouped
+        by shape and each group runs through the detector and recognizer
+        together. Lone images fall back to ``readtext``.
         
-        for bbox, text, confidence in results:
-            # Convert bbox from polygon to rectangle
-            x_coords = [point[0] for point in bbox]
-            y_coords = [point[1] for point in bbox]
-            x1, y1 = min(x_coords), min(y_coords)
-            x2, y2 = max(x_coords), max(y_coords)
+        Args:
+            images: PIL Images to process.
             
-            words.append(OCRWord(
+        Returns:
+            One OCRResult per image, in the same order.
+        """
+        arrays = [np.asarray(image) for image in images]
+        
+        groups: dict[tuple[int, ...], list[int]] = {}
+        for i, array in enumerate(arrays):
+            groups.setdefault(array.shape, []).append(i)
+        
+        ocr_results: list[OCRResult | None] = [None] * len(arrays)
+        for indices in groups.values():
+            with self._inference_context():
+                if len(indices) == 1:
+                    batch = [self.reader.readtext(arrays[indices[0]])]
+                else:
+                    batch = self.reader.readtext_batched(
+                        [arrays[i] for i in indices],
+                        batch_size=self.batch_size,
+                    )
+            for i, results in zip(indices, batch):
+                ocr_results[i] = self._build_result(results)
+        
+        return ocr_results
+    
+    def _build_result(self, results: list) -> OCRResult:
+        """Convert raw EasyOCR detections into an OCRResult."""
+        if not results:
+            return OCRResult(
+                full_text="",
+                words=[],
+                confidence=0.0,
+                language=",".join(self.languages),
+                engine_used="easyocr",
+            )
+        
+        # Convert all bbox polygons (N, 4, 2) to rectangles in one pass
+        polygons = np.asarray([r[0] for r in results], dtype=np.float32)
+        mins = polygons.min(axis=1).astype(np.int32).tolist()
+        maxs = polygons.max(axis=1).astype(np.int32).tolist()
+        confidences = np.fromiter((r[2] for r in results), dtype=np.float64, count=len(results))
+        
+        words = [
+            OCRWord(
                 text=text,
                 confidence=confidence,
-                bbox=(int(x1), int(y1), int(x2), int(y2)),
-            ))
-            total_confidence += confidence
+                bbox=(x1, y1, x2, y2),
+            )
+            for (_, text, confidence), (x1, y1), (x2, y2) in zip(results, mins, maxs)
+        ]
         
         # Build full text preserving rough layout
         full_text = self._build_text_from_words(words)
-        avg_confidence = total_confidence / len(words) if words else 0.0
+        avg_confidence = float(confidences.mean())
         
         return OCRResult(
             full_text=full_text,
@@ -100,42 +204,45 @@ class EasyOCREngine:
         if not words:
             return ""
         
-        # Sort by y-coordinate (top to bottom), then x (left to right)
-        sorted_words = sorted(words, key=lambda w: (w.bbox[1], w.bbox[0]))
-        
-        lines = []
-        current_line = []
-        current_y = sorted_words[0].bbox[1] if sorted_words else 0
         line_height_threshold = 20  # Pixels between lines
         
-        for word in sorted_words:
-            if abs(word.bbox[1] - current_y) > line_height_threshold:
-                # New line
-                if current_line:
-                    lines.append(" ".join(w.text for w in current_line))
-                current_line = [word]
-                current_y = word.bbox[1]
-            else:
-                current_line.append(word)
+        xs = np.fromiter((w.bbox[0] for w in words), dtype=np.int32, count=len(words))
+        ys = np.fromiter((w.bbox[1] for w in words), dtype=np.int32, count=len(words))
         
-        if current_line:
-            lines.append(" ".join(w.text for w in current_line))
+        # Sort by y-coordinate (top to bottom), then x (left to right)
+        order = np.lexsort((xs, ys))
+        
+        # Assign line ids: a new line starts wherever the vertical gap
+        # exceeds the threshold
+        line_ids = np.empty(len(words), dtype=np.int32)
+        line_ids[order[0]] = 0
+        line_ids[order[1:]] = np.cumsum(np.diff(ys[order]) > line_height_threshold)
+        
+        # Reorder by line, then x within each line, in a single sort
+        order = np.lexsort((xs, line_ids))
+        breaks = np.flatnonzero(np.diff(line_ids[order])) + 1
         
-        return "\n".join(lines)
+        return "\n".join(
+            " ".join(words[i].text for i in line)
+            for line in np.split(order, breaks)
+        )
 
 
 class TesseractEngine:
     """Tesseract OCR fallback engine."""
     
-    def __init__(self, language: str = "eng"):
+    def __init__(self, language: str = "eng", config: str = "--oem 1 --psm 6"):
         """Initialize Tesseract.
         
         Args:
             language: Tesseract language code.
+            config: Extra Tesseract CLI options (default: LSTM engine,
+                single uniform text block).
         """
         import pytesseract
         
         self.language = language
+        self.config = config
         self.pytesseract = pytesseract
     
     def recognize(self, image: Image.Image) -> OCRResult:
@@ -147,10 +254,17 @@ class TesseractEngine:
         Returns:
             OCRResult with extracted text.
         """
-        # Get detailed word-level data
+        # pytesseract writes its input to a temp file, PNG-encoding any image
+        # without a format; hand it raw grayscale (PGM) instead, which skips
+        # compression and is what Tesseract binarizes from anyway
+        raw_image = image.convert("L")
+        raw_image.format = "PPM"
+        
+        # Get detailed word-level data (single Tesseract run)
         data = self.pytesseract.image_to_data(
-            image, 
+            raw_image, 
             lang=self.language,
+            config=self.config,
             output_type=self.pytesseract.Output.DICT
         )
         
@@ -158,25 +272,45 @@ class TesseractEngine:
         total_confidence = 0
         valid_word_count = 0
         
+        # Rebuild full text from the same run: words on a line are joined by
+        # spaces, lines by newlines and paragraphs by a blank line
+        lines = []
+        current_line = []
+        current_key = None
+        
         for i, text in enumerate(data["text"]):
-            if text.strip():
-                conf = float(data["conf"][i])
-                if conf > 0:  # Tesseract uses -1 for invalid
-                    words.append(OCRWord(
-                        text=text,
-                        confidence=conf / 100,  # Normalize to 0-1
-                        bbox=(
-                            data["left"][i],
-                            data["top"][i],
-                            data["left"][i] + data["width"][i],
-                            data["top"][i] + data["height"][i],
-                        ),
-                    ))
-                    total_confidence += conf / 100
-                    valid_word_count += 1
-        
-        # Get full text
-        full_text = self.pytesseract.image_to_string(image, lang=self.language)
+            if not text.strip():
+                continue
+            
+            key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            if key != current_key:
+                if current_line:
+                    lines.append(" ".join(current_line))
+                    if key[:2] != current_key[:2]:
+                        lines.append("")
+                current_line = []
+                current_key = key
+            current_line.append(text)
+            
+            conf = float(data["conf"][i])
+            if conf > 0:  # Tesseract uses -1 for invalid
+                words.append(OCRWord(
+                    text=text,
+                    confidence=conf / 100,  # Normalize to 0-1
+                    bbox=(
+                        data["left"][i],
+                        data["top"][i],
+                        data["left"][i] + data["width"][i],
+                        data["top"][i] + data["height"][i],
+                    ),
+                ))
+                total_confidence += conf / 100
+                valid_word_count += 1
+        
+        if current_line:
+            lines.append(" ".join(current_line))
+        
+        full_text = "\n".join(lines)
         avg_confidence = total_confidence / valid_word_count if valid_word_count else 0.0
         
         return OCRResult(
@@ -212,6 +346,11 @@ class OCRPipeline:
         self._primary_initialized = False
         self._fallback_initialized = False
         self._fallback_available = True  # Track if fallback can be used
+        
+        # The engines aren't safe to share across threads, and their lazy
+        # setup (loading model weights) must only run once, so callers on
+        # several threads take turns through the pipeline
+        self._lock = threading.Lock()
     
     def _ensure_primary(self):
         """Lazy initialize primary engine."""
@@ -240,26 +379,16 @@ class OCRPipeline:
         Returns:
             OCRResult from best performing engine.
         """
+        with self._lock:
+            return self._process(image)
+    
+    def _process(self, image: Image.Image) -> OCRResult:
+        """Process an image; the caller must hold ``_lock``."""
         # Try primary engine (EasyOCR)
         self._ensure_primary()
         try:
             result = self.primary_engine.recognize(image)
-            
-            if result.confidence >= self.confidence_threshold:
-                return result
-            
-            # Low confidence, try fallback if available
-            self._ensure_fallback()
-            if self._fallback_available and self.fallback_engine:
-                try:
-                    fallback_result = self.fallback_engine.recognize(image)
-                    # Return whichever has higher confidence
-                    if fallback_result.confidence > result.confidence:
-                        return fallback_result
-                except Exception:
-                    pass  # Fallback failed, use primary result
-            
-            return result
+            return self._apply_fallback(image, result)
             
         except Exception as e:
             # Primary failed, try fallback
@@ -272,4 +401,58 @@ class OCRPipeline:
                         f"Both OCR engines failed. Primary: {e}, Fallback: {fallback_error}"
                     )
             raise RuntimeError(f"OCR failed: {e}")
-
+    
+    def process_many(self, images: list[Image.Image]) -> list[OCRResult]:
+        """Process several images through the OCR pipeline.
+        
+        Uses the primary engine's ``recognize_batch`` when it has one, so all
+        pages share batched inference; low-confidence pages are still retried
+        individually on the fallback engine.
+        
+        Args:
+            images: PIL Images to process.
+            
+        Returns:
+            One OCRResult per image, in the same order.
+        """
+        if not images:
+            return []
+        
+        with self._lock:
+            self._ensure_primary()
+            recognize_batch = getattr(self.primary_engine, "recognize_batch", None)
+            if recognize_batch is None:
+                return [self._process(image) for image in images]
+            
+            try:
+                results = recognize_batch(images)
+            except Exception:
+                # Batched inference failed (e.g. out of GPU memory); go one by one
+                return [self._process(image) for image in images]
+            
+            return [
+                self._apply_fallback(image, result)
+                for image, result in zip(images, results)
+            ]
+    
+    def _apply_fallback(self, image: Image.Image, result: OCRResult) -> OCRResult:
+        """Retry a low-confidence primary result on the fallback engine.
+        
+        Returns:
+            Whichever result has the higher confidence.
+        """
+        if result.confidence >= self.confidence_threshold:
+            return result
+        
+        # Low confidence, try fallback if available
+        self._ensure_fallback()
+        if self._fallback_available and self.fallback_engine:
+            try:
+                fallback_result = self.fallback_engine.recognize(image)
+                # Return whichever has higher confidence
+                if fallback_result.confidence > result.confidence:
+                    return fallback_result
+            except Exception:
+                pass  # Fallback failed, use primary result
+        
+        return result
@@ -1,13 +1,51 @@
 """DOCX document parsing."""
 
 import io
+import zipfile
+from contextlib import ExitStack
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
-from docx import Document as DocxDocument
-from docx.table import Table
+from lxml import etree
 
+# OOXML namespaces used by word/document.xml and docProps/core.xml
+_NAMESPACES = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+}
 
-@dataclass
+
+def _qn(tag: str) -> str:
+    """Convert a prefixed tag like ``w:p`` to lxml's Clark notation."""
+    prefix, local = tag.split(":")
+    return f"{{{_NAMESPACES[prefix]}}}{local}"
+
+
+# Parses uploaded XML without resolving entities or fetching anything,
+# like python-docx's own parser, so a crafted file can't pull in local
+# files (XXE) or blow up through nested entity expansion
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+
+_W_BODY = _qn("w:body")
+_W_P = _qn("w:p")
+_W_R = _qn("w:r")
+_W_HYPERLINK = _qn("w:hyperlink")
+_W_T = _qn("w:t")
+_W_TAB = _qn("w:tab")
+_W_BR = _qn("w:br")
+_W_CR = _qn("w:cr")
+_W_TBL = _qn("w:tbl")
+_W_TR = _qn("w:tr")
+_W_TC = _qn("w:tc")
+_W_TC_PR = _qn("w:tcPr")
+_W_GRID_SPAN = _qn("w:gridSpan")
+_W_V_MERGE = _qn("w:vMerge")
+_W_VAL = _qn("w:val")
+
+
+@dataclass(slots=True)
 class DocxContent:
     """Content extracted from a DOCX file."""
     
@@ -17,21 +55,141 @@ class DocxContent:
     metadata: dict = field(default_factory=dict)
 
 
+def _paragraph_text(p) -> str:
+    """Get the text of a ``<w:p>`` element, as python-docx's ``Paragraph.text``.
+    
+    Only the paragraph's own runs and hyperlink runs count; nested content
+    such as text boxes, which Word writes twice (``mc:Choice`` and
+    ``mc:Fallback``), is skipped.
+    """
+    parts = []
+    for run in _iter_runs(p):
+        for child in run:
+            if child.tag == _W_T:
+                parts.append(child.text or "")
+            elif child.tag == _W_TAB:
+                parts.append("\t")
+            elif child.tag in (_W_BR, _W_CR):
+                parts.append("\n")
+    return "".join(parts)
+
+
+def _iter_runs(p):
+    """Yield a paragraph's direct ``<w:r>`` children and its hyperlinks' runs."""
+    for child in p.iterchildren(_W_R, _W_HYPERLINK):
+        if child.tag == _W_R:
+            yield child
+        else:
+            yield from child.iterchildren(_W_R)
+
+
+def _cell_text(tc) -> str:
+    """Get the text of a ``<w:tc>`` element, one line per paragraph."""
+    return "\n".join(_paragraph_text(p) for p in tc.iterchildren(_W_P)).strip()
+
+
+def _parse_w3cdtf(value: str | None) -> str:
+    """Format a core-properties timestamp the way python-docx's datetime prints."""
+    if not value:
+        return ""
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return str(parsed.astimezone(timezone.utc))
+
+
 class DocxParser:
     """Parse DOCX documents and extract content."""
     
+    def __init__(self, use_python_docx: bool = False):
+        """Initialize DOCX parser.
+        
+        Args:
+            use_python_docx: Always parse through python-docx's full package
+                model instead of reading ``word/document.xml`` directly.
+                Non-standard packages fall back to python-docx regardless.
+        """
+        self.use_python_docx = use_python_docx
+    
     def parse(self, document) -> DocxContent:
         """Parse DOCX and extract text and tables.
         
         Args:
             document: LoadedDocument containing DOCX bytes.
-            
+        
         Returns:
             DocxContent with extracted data.
         """
+        if self.use_python_docx:
+            return self._parse_with_python_docx(document)
+        
+        try:
+            with ExitStack() as stack:
+                package = stack.enter_context(
+                    zipfile.ZipFile(self._open_package(document, stack))
+                )
+                body = etree.fromstring(
+                    package.read("word/document.xml"), _XML_PARSER
+                ).find(_W_BODY)
+                try:
+                    core = etree.fromstring(package.read("docProps/core.xml"), _XML_PARSER)
+                except KeyError:
+                    core = None
+        except KeyError:
+            # Main part stored under a non-standard name; let python-docx
+            # resolve it through the package relationships
+            return self._parse_with_python_docx(document)
+        
+        if body is None:
+            return self._parse_with_python_docx(document)
+        
+        # Extract body-level paragraphs and tables
+        paragraphs = [
+            text for text in (_paragraph_text(p) for p in body.iterchildren(_W_P))
+            if text.strip()
+        ]
+        tables = [
+            table_data for table_data in (
+                self._extract_table(tbl) for tbl in body.iterchildren(_W_TBL)
+            )
+            if table_data
+        ]
+        
+        return DocxContent(
+            paragraphs=paragraphs,
+            tables=tables,
+            full_text=self._build_full_text(paragraphs, tables),
+            metadata=self._extract_metadata(core),
+        )
+    
+    def _open_package(self, document, stack: ExitStack):
+        """Open the DOCX bytes as a seekable file for zipfile.
+        
+        Files loaded from disk are read straight from the file, so zipfile
+        only pulls in the central directory and the members it needs; byte
+        uploads are wrapped in a BytesIO that shares the existing buffer.
+        """
+        source_path = getattr(document, "source_path", None)
+        if source_path is not None:
+            return stack.enter_context(open(source_path, "rb"))
+        return io.BytesIO(document.content)
+    
+    def _parse_with_python_docx(self, document) -> DocxContent:
+        """Parse DOCX through python-docx's full package model.
+        
+        Args:
+            document: LoadedDocument containing DOCX bytes.
+        
+        Returns:
+            DocxContent with extracted data.
+        """
+        from docx import Document as DocxDocument
+        
         # Load DOCX from bytes
-        docx_file = io.BytesIO(document.content)
-        doc = DocxDocument(docx_file)
+        doc = DocxDocument(io.BytesIO(document.content))
         
         # Extract paragraphs
         paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
@@ -39,64 +197,98 @@ class DocxParser:
         # Extract tables
         tables = []
         for table in doc.tables:
-            table_data = self._extract_table(table)
+            table_data = self._extract_table(table._tbl)
             if table_data:
                 tables.append(table_data)
         
-        # Build full text
-        full_text = "\n".join(paragraphs)
-        
-        # Add table content to full text
-        for table in tables:
-            for row in table:
-                full_text += "\n" + " | ".join(row)
-        
-        # Extract metadata
-        metadata = self._extract_metadata(doc)
+        core_props = doc.core_properties
+        metadata = {
+            "author": core_props.author or "",
+            "title": core_props.title or "",
+            "subject": core_props.subject or "",
+            "created": str(core_props.created) if core_props.created else "",
+            "modified": str(core_props.modified) if core_props.modified else "",
+        }
         
         return DocxContent(
             paragraphs=paragraphs,
             tables=tables,
-            full_text=full_text,
+            full_text=self._build_full_text(paragraphs, tables),
             metadata=metadata,
         )
     
-    def _extract_table(self, table: Table) -> list[list[str]]:
+    def _build_full_text(
+        self,
+        paragraphs: list[str],
+        tables: list[list[list[str]]],
+    ) -> str:
+        """Build full text: paragraphs followed by one line per table row."""
+        parts = ["\n".join(paragraphs)]
+        parts.extend(" | ".join(row) for table in tables for row in table)
+        return "\n".join(parts)
+    
+    def _extract_table(self, tbl) -> list[list[str]]:
         """Extract data from a DOCX table.
         
+        Walks the ``<w:tbl>`` XML directly. Merged cells repeat their text
+        across every grid column they cover, as python-docx's ``row.cells``
+        does.
+        
         Args:
-            table: python-docx Table object.
-            
+            tbl: ``<w:tbl>`` lxml element.
+        
         Returns:
             List of rows, each row is a list of cell values.
         """
         table_data = []
+        previous_row: list[str] = []
         
-        for row in table.rows:
+        for tr in tbl.iterchildren(_W_TR):
             row_data = []
-            for cell in row.cells:
-                # Get cell text, handling merged cells
-                cell_text = cell.text.strip()
-                row_data.append(cell_text)
+            for tc in tr.iterchildren(_W_TC):
+                span = 1
+                is_continuation = False
+                tc_pr = tc.find(_W_TC_PR)
+                if tc_pr is not None:
+                    grid_span = tc_pr.find(_W_GRID_SPAN)
+                    if grid_span is not None:
+                        span = int(grid_span.get(_W_VAL, 1))
+                    v_merge = tc_pr.find(_W_V_MERGE)
+                    if v_merge is not None:
+                        is_continuation = v_merge.get(_W_VAL, "continue") == "continue"
+                
+                # Vertically merged cells show the text of the cell above
+                column = len(row_data)
+                if is_continuation and column < len(previous_row):
+                    cell_text = previous_row[column]
+                else:
+                    cell_text = _cell_text(tc)
+                row_data.extend([cell_text] * span)
+            
             table_data.append(row_data)
+            previous_row = row_data
         
         return table_data
     
-    def _extract_metadata(self, doc: DocxDocument) -> dict:
+    def _extract_metadata(self, core) -> dict:
         """Extract document metadata.
         
         Args:
-            doc: python-docx Document object.
-            
+            core: Root element of ``docProps/core.xml``, or None if absent.
+        
         Returns:
             Dictionary of metadata.
         """
-        core_props = doc.core_properties
+        def text_of(tag: str) -> str:
+            if core is None:
+                return ""
+            element = core.find(_qn(tag))
+            return (element.text or "") if element is not None else ""
         
         return {
-            "author": core_props.author or "",
-            "title": core_props.title or "",
-            "subject": core_props.subject or "",
-            "created": str(core_props.created) if core_props.created else "",
-            "modified": str(core_props.modified) if core_props.modified else "",
+            "author": text_of("dc:creator"),
+            "title": text_of("dc:title"),
+            "subject": text_of("dc:subject"),
+            "created": _parse_w3cdtf(text_of("dcterms:created")),
+            "modified": _parse_w3cdtf(text_of("dcterms:modified")),
         }
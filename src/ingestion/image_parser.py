@@ -3,12 +3,14 @@
 import io
 from dataclasses import dataclass
 
-from PIL import Image, ExifTags
+import cv2
+import numpy as np
+from PIL import Image
 
 from .loader import LoadedDocument
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
     """Information about a loaded image."""
     
@@ -21,6 +23,23 @@ class ImageInfo:
     orientation: int
 
 
+def _identity(pixels: np.ndarray) -> np.ndarray:
+    return pixels
+
+
+# EXIF orientation -> transform to upright, matching ImageOps.exif_transpose.
+# Each returns a strided view, so no pixels are copied.
+_ORIENTATION_TRANSFORMS = {
+    2: lambda a: a[:, ::-1],  # mirror horizontal
+    3: lambda a: a[::-1, ::-1],  # rotate 180
+    4: lambda a: a[::-1],  # mirror vertical
+    5: lambda a: a.transpose(1, 0, 2),  # transpose
+    6: lambda a: np.rot90(a, -1),  # rotate 90 CW
+    7: lambda a: a[::-1, ::-1].transpose(1, 0, 2),  # transverse
+    8: lambda a: np.rot90(a),  # rotate 90 CCW
+}
+
+
 class ImageParser:
     """Parse and process image documents."""
     
@@ -35,6 +54,10 @@ class ImageParser:
     def parse(self, document: LoadedDocument) -> ImageInfo:
         """Parse image document and extract information.
         
+        After decoding, orientation, alpha flattening and resizing run on a
+        single NumPy array: orientation is a strided view, so the pixels are
+        only copied by the blend and the resize.
+        
         Args:
             document: LoadedDocument containing image bytes.
             
@@ -42,88 +65,95 @@ class ImageParser:
             ImageInfo with processed image.
         """
         image = Image.open(io.BytesIO(document.content))
+        source_format = image.format or "UNKNOWN"
+        
+        # Let libjpeg decode oversized JPEGs at 1/2, 1/4 or 1/8 scale (never
+        # below max_dimension); _resize_if_needed does the exact final step
+        if image.format == "JPEG":
+            image.draft("RGB", (self.max_dimension, self.max_dimension))
         
         # Handle EXIF orientation
-        orientation = 1
-        has_exif = False
+        exif = image.getexif()
+        has_exif = bool(exif)
+        orientation = exif.get(0x0112, 1)  # 0x0112 = Orientation tag
         
-        try:
-            exif = image._getexif()
-            if exif:
-                has_exif = True
-                for tag, value in exif.items():
-                    tag_name = ExifTags.TAGS.get(tag, tag)
-                    if tag_name == "Orientation":
-                        orientation = value
-                        break
-        except (AttributeError, KeyError):
-            pass
-        
-        # Apply orientation correction
-        image = self._apply_orientation(image, orientation)
-        
-        # Convert to RGB if necessary (for OCR compatibility)
-        if image.mode in ("RGBA", "LA", "P"):
-            background = Image.new("RGB", image.size, (255, 255, 255))
-            if image.mode == "P":
-                image = image.convert("RGBA")
-            background.paste(image, mask=image.split()[-1] if image.mode == "RGBA" else None)
-            image = background
-        elif image.mode != "RGB":
-            image = image.convert("RGB")
-        
-        # Resize if too large
-        image = self._resize_if_needed(image)
+        needs_resize = max(image.size) > self.max_dimension
+        if image.mode == "RGB" and orientation == 1 and not needs_resize:
+            image.load()
+        else:
+            # Convert to RGB if necessary (for OCR compatibility)
+            if image.mode in ("RGBA", "LA", "P"):
+                pixels = np.asarray(image.convert("RGBA"))
+            elif image.mode != "RGB":
+                pixels = np.asarray(image.convert("RGB"))
+            else:
+                pixels = np.asarray(image)
+            
+            # Apply orientation correction
+            pixels = _ORIENTATION_TRANSFORMS.get(orientation, _identity)(pixels)
+            
+            if pixels.shape[2] == 4:
+                pixels = self._flatten_alpha(pixels)
+            
+            # Resize if too large
+            pixels = self._resize_if_needed(pixels)
+            image = Image.fromarray(np.ascontiguousarray(pixels), "RGB")
         
         return ImageInfo(
             image=image,
             width=image.width,
             height=image.height,
-            format=image.format or "UNKNOWN",
+            format=source_format,
             mode=image.mode,
             has_exif=has_exif,
             orientation=orientation,
         )
     
-    def _apply_orientation(self, image: Image.Image, orientation: int) -> Image.Image:
-        """Apply EXIF orientation correction.
+    def _flatten_alpha(self, rgba: np.ndarray) -> np.ndarray:
+        """Composite RGBA pixels over a white background.
         
         Args:
-            image: PIL Image.
-            orientation: EXIF orientation value (1-8).
+            rgba: HxWx4 uint8 array.
             
         Returns:
-            Corrected image.
+            HxWx3 uint8 RGB array.
         """
-        if orientation == 2:
-            return image.transpose(Image.FLIP_LEFT_RIGHT)
-        elif orientation == 3:
-            return image.rotate(180)
-        elif orientation == 4:
-            return image.transpose(Image.FLIP_TOP_BOTTOM)
-        elif orientation == 5:
-            return image.rotate(-90, expand=True).transpose(Image.FLIP_LEFT_RIGHT)
-        elif orientation == 6:
-            return image.rotate(-90, expand=True)
-        elif orientation == 7:
-            return image.rotate(90, expand=True).transpose(Image.FLIP_LEFT_RIGHT)
-        elif orientation == 8:
-            return image.rotate(90, expand=True)
-        return image
+        rgb = rgba[..., :3].astype(np.uint16)
+        alpha = rgba[..., 3:].astype(np.uint16)
+        
+        # rgb * a/255 + 255 * (1 - a/255), with x/255 computed exactly as
+        # (x + 128 + ((x + 128) >> 8)) >> 8 so opaque and white stay exact
+        blended = rgb * alpha + 255 * (255 - alpha) + 128
+        blended += blended >> 8
+        blended >>= 8
+        
+        return blended.astype(np.uint8)
     
-    def _resize_if_needed(self, image: Image.Image) -> Image.Image:
+    def _resize_if_needed(self, pixels: np.ndarray) -> np.ndarray:
         """Resize image if it exceeds maximum dimension.
         
         Args:
-            image: PIL Image.
+            pixels: HxWxC uint8 array.
             
         Returns:
-            Resized image or original if within limits.
+            Resized array or original if within limits.
         """
-        width, height = image.size
+        height, width = pixels.shape[:2]
+        target = self._target_size(width, height)
+        if target is None:
+            return pixels
         
+        # INTER_AREA is OpenCV's antialiased filter for downscaling
+        return cv2.resize(
+            np.ascontiguousarray(pixels),
+            target,
+            interpolation=cv2.INTER_AREA,
+        )
+    
+    def _target_size(self, width: int, height: int) -> tuple[int, int] | None:
+        """Get the (width, height) to resize to, or None if within limits."""
         if width <= self.max_dimension and height <= self.max_dimension:
-            return image
+            return None
         
         # Calculate new dimensions maintaining aspect ratio
         if width > height:
@@ -133,4 +163,110 @@ class ImageParser:
             new_height = self.max_dimension
             new_width = int(width * (self.max_dimension / height))
         
-        return image.resize((new_width, new_height), Image.LANCZOS)
+        return new_width, new_height
+
+
+class GPUImageParser(ImageParser):
+    """Image parser that decodes batches of JPEGs on the GPU.
+    
+    Uses torchvision's nvJPEG decoder, which runs on the GPU's hardware JPEG
+    engine where present, and resizes on the GPU before copying back.
+    Anything else (other formats, single images, JPEGs nvJPEG rejects) goes
+    through the CPU path of ImageParser.
+    """
+    
+    def __init__(self, max_dimension: int = 4096, device: str = "cuda"):
+        """Initialize GPU image parser.
+        
+        Args:
+            max_dimension: Maximum width/height before resizing.
+            device: CUDA device to decode on.
+        """
+        super().__init__(max_dimension)
+        self.device = device
+    
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether CUDA and torchvision's GPU JPEG decoder are usable."""
+        try:
+            import torch
+            from torchvision.io import decode_jpeg  # noqa: F401
+        except ImportError:
+            return False
+        return torch.cuda.is_available()
+    
+    def parse_many(self, documents: list[LoadedDocument]) -> list[ImageInfo]:
+        """Parse several image documents, decoding their JPEGs in one batch.
+        
+        Args:
+            documents: LoadedDocuments containing image bytes.
+            
+        Returns:
+            ImageInfo for each document, in order.
+        """
+        results: list[ImageInfo | None] = [None] * len(documents)
+        jpeg_indices = [
+            i for i, document in enumerate(documents)
+            if document.content.startswith(b"\xff\xd8\xff")
+        ]
+        
+        # A single image doesn't amortize the host/device copies
+        if len(jpeg_indices) > 1:
+            try:
+                decoded = self._decode_jpegs([documents[i] for i in jpeg_indices])
+            except RuntimeError:
+                # nvJPEG rejects some encodings (e.g. CMYK); use the CPU path
+                decoded = []
+            for i, info in zip(jpeg_indices, decoded):
+                results[i] = info
+        
+        return [
+            info if info is not None else self.parse(document)
+            for info, document in zip(results, documents)
+        ]
+    
+    def _decode_jpegs(self, documents: list[LoadedDocument]) -> list[ImageInfo]:
+        """Decode and resize JPEGs on the GPU, then orient them on the host."""
+        import torch
+        import torch.nn.functional as tnf
+        from torchvision.io import ImageReadMode, decode_jpeg
+        
+        # Reading EXIF only parses the headers
+        exifs = [Image.open(io.BytesIO(document.content)).getexif() for document in documents]
+        data = [
+            torch.frombuffer(bytearray(document.content), dtype=torch.uint8)
+            for document in documents
+        ]
+        
+        infos = []
+        with torch.inference_mode():
+            decoded = decode_jpeg(data, mode=ImageReadMode.RGB, device=self.device)
+            for exif, tensor in zip(exifs, decoded):
+                height, width = tensor.shape[-2:]
+                target = self._target_size(width, height)
+                if target is not None:
+                    tensor = tnf.interpolate(
+                        tensor[None].float(),
+                        size=(target[1], target[0]),
+                        mode="bilinear",
+                        antialias=True,
+                    )[0].round_().clamp_(0, 255).to(torch.uint8)
+                
+                # Resizing commutes with orientation, so orient the smaller
+                # image on the host as a strided view
+                pixels = tensor.permute(1, 2, 0).cpu().numpy()
+                orientation = exif.get(0x0112, 1)  # 0x0112 = Orientation tag
+                pixels = _ORIENTATION_TRANSFORMS.get(orientation, _identity)(pixels)
+                image = Image.fromarray(np.ascontiguousarray(pixels), "RGB")
+                
+                infos.append(ImageInfo(
+                    image=image,
+                    width=image.width,
+                    height=image.height,
+                    format="JPEG",
+                    mode=image.mode,
+                    has_exif=bool(exif),
+                    orientation=orientation,
+                ))
+        
+        return infos
@@ -1,6 +1,5 @@
 """Document loader with file type detection and validation."""
 
-import mimetypes
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -17,7 +16,7 @@ class DocumentType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadedDocument:
     """Represents a loaded document ready for processing."""
     
@@ -28,21 +27,15 @@ class LoadedDocument:
     images: list[Image.Image] = field(default_factory=list)
     text_content: str = ""
     metadata: dict = field(default_factory=dict)
+    source_path: Path | None = None  # Set only when loaded from a real file
 
 
-MIME_TYPE_MAP = {
-    "application/pdf": DocumentType.PDF,
-    "image/jpeg": DocumentType.IMAGE,
-    "image/png": DocumentType.IMAGE,
-    "image/tiff": DocumentType.IMAGE,
-    "image/webp": DocumentType.IMAGE,
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": DocumentType.DOCX,
-}
-
 EXTENSION_MAP = {
     ".pdf": DocumentType.PDF,
     ".jpg": DocumentType.IMAGE,
     ".jpeg": DocumentType.IMAGE,
+    ".jpe": DocumentType.IMAGE,
+    ".jfif": DocumentType.IMAGE,
     ".png": DocumentType.IMAGE,
     ".tiff": DocumentType.IMAGE,
     ".tif": DocumentType.IMAGE,
@@ -51,6 +44,15 @@ EXTENSION_MAP = {
 }
 
 
+# File signatures keyed by first byte, so detection is a single dict lookup
+MAGIC_BYTES: dict[int, tuple[tuple[bytes, DocumentType], ...]] = {
+    0x25: ((b"%PDF", DocumentType.PDF),),
+    0x89: ((b"\x89PNG\r\n\x1a\n", DocumentType.IMAGE),),
+    0xFF: ((b"\xff\xd8", DocumentType.IMAGE),),  # JPEG
+    0x50: ((b"PK\x03\x04", DocumentType.DOCX),),  # ZIP (DOCX)
+}
+
+
 class DocumentValidationError(Exception):
     """Raised when document validation fails."""
     pass
@@ -68,7 +70,7 @@ class DocumentLoader:
         self.max_file_size_bytes = max_file_size_bytes
     
     def detect_type(self, file_path: Path, content: bytes | None = None) -> DocumentType:
-        """Detect document type from file extension and MIME type.
+        """Detect document type from file extension or magic bytes.
         
         Args:
             file_path: Path to the file.
@@ -78,25 +80,15 @@ class DocumentLoader:
             Detected DocumentType.
         """
         # Try extension first
-        ext = file_path.suffix.lower()
-        if ext in EXTENSION_MAP:
-            return EXTENSION_MAP[ext]
-        
-        # Try MIME type
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if mime_type and mime_type in MIME_TYPE_MAP:
-            return MIME_TYPE_MAP[mime_type]
+        doc_type = EXTENSION_MAP.get(file_path.suffix.lower())
+        if doc_type is not None:
+            return doc_type
         
         # Try magic bytes if content provided
         if content:
-            if content[:4] == b"%PDF":
-                return DocumentType.PDF
-            if content[:8] == b"\x89PNG\r\n\x1a\n":
-                return DocumentType.IMAGE
-            if content[:2] == b"\xff\xd8":  # JPEG
-                return DocumentType.IMAGE
-            if content[:4] == b"PK\x03\x04":  # ZIP (DOCX)
-                return DocumentType.DOCX
+            for signature, doc_type in MAGIC_BYTES.get(content[0], ()):
+                if content.startswith(signature):
+                    return doc_type
         
         return DocumentType.UNKNOWN
     
@@ -141,10 +133,19 @@ class DocumentLoader:
         Raises:
             DocumentValidationError: If file doesn't exist or validation fails.
         """
-        if not file_path.exists():
-            raise DocumentValidationError(f"File not found: {file_path}")
+        try:
+            size = file_path.stat().st_size
+        except FileNotFoundError:
+            raise DocumentValidationError(f"File not found: {file_path}") from None
+        
+        # Reject oversized files before reading them
+        if size > self.max_file_size_bytes:
+            raise DocumentValidationError(
+                f"File size {size} bytes exceeds maximum "
+                f"{self.max_file_size_bytes} bytes"
+            )
         
-        content = file_path.read_bytes()
+        content = self._read_file(file_path, size)
         self.validate(file_path, content)
         
         doc_type = self.detect_type(file_path, content)
@@ -155,8 +156,35 @@ class DocumentLoader:
             file_size=len(content),
             content=content,
             metadata={"filename": file_path.name},
+            source_path=file_path,
         )
     
+    def _read_file(self, file_path: Path, size: int) -> bytes:
+        """Read a file into a single preallocated buffer.
+        
+        The buffer is returned as immutable bytes, which is what
+        ``LoadedDocument.content`` promises its consumers.
+        
+        Args:
+            file_path: Path to the file.
+            size: Expected file size from ``stat()``.
+            
+        Returns:
+            File content.
+        """
+        buffer = bytearray(size)
+        offset = 0
+        with memoryview(buffer) as view:
+            with file_path.open("rb", buffering=0) as f:
+                while offset < size:
+                    read = f.readinto(view[offset:])
+                    if not read:
+                        break
+                    offset += read
+            
+            # Stop at offset in case the file shrank between stat() and read
+            return bytes(view[:offset])
+    
     def load_from_bytes(
         self, 
         content: bytes, 
@@ -1,6 +1,12 @@
 """PDF document parsing and image extraction."""
 
 import io
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 
 import fitz  # PyMuPDF
@@ -9,7 +15,7 @@ from PIL import Image
 from .loader import LoadedDocument
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFPage:
     """Represents a single PDF page."""
     
@@ -20,58 +26,184 @@ class PDFPage:
     height: float
 
 
+def _iter_rendered_pages(
+    pdf_doc: fitz.Document,
+    page_nums: range,
+    zoom: float,
+    grayscale: bool = True,
+) -> Iterator[PDFPage]:
+    """Extract text and render a range of pages of an open PDF, one at a time.
+    
+    Args:
+        pdf_doc: Open PyMuPDF document.
+        page_nums: Zero-based page indices.
+        zoom: Render scale relative to 72 DPI.
+        grayscale: Render 8-bit grayscale ("L") images instead of RGB.
+        
+    Yields:
+        PDFPage for each page, in order.
+    """
+    # Identical for every page, so build once
+    matrix = fitz.Matrix(zoom, zoom)
+    colorspace, mode = (fitz.csGRAY, "L") if grayscale else (fitz.csRGB, "RGB")
+    load_page = pdf_doc.load_page
+    
+    for page_num in page_nums:
+        page = load_page(page_num)
+        
+        # Extract text
+        text = page.get_text("text")
+        
+        # Render page to image
+        pixmap = page.get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False)
+        
+        # Wrap the raw samples directly instead of a PNG round-trip;
+        # Pixmap.samples is already a fresh bytes copy, which the image
+        # keeps a reference to
+        image = Image.frombuffer(
+            mode, (pixmap.width, pixmap.height), pixmap.samples,
+            "raw", mode, pixmap.stride, 1,
+        )
+        pixmap = None
+        
+        rect = page.rect
+        yield PDFPage(
+            page_number=page_num + 1,
+            text=text,
+            image=image,
+            width=rect.width,
+            height=rect.height,
+        )
+
+
+def _render_page_range(
+    content: bytes,
+    start: int,
+    stop: int,
+    zoom: float,
+    grayscale: bool = True,
+) -> list[PDFPage]:
+    """Render pages ``start`` to ``stop`` in a worker process.
+    
+    MuPDF is not thread-safe, so each worker opens its own document.
+    """
+    pdf_doc = fitz.open(stream=content, filetype="pdf")
+    try:
+        return list(_iter_rendered_pages(pdf_doc, range(start, stop), zoom, grayscale))
+    finally:
+        pdf_doc.close()
+
+
+# Render processes shared by every parser, started on first use; spawning a
+# pool per document costs far more than rendering a typical one
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the process-wide render pool, creating it on first use."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _render_pool
+
+
+def _discard_render_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken render pool so the next document starts a new one."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is pool:
+            _render_pool = None
+    pool.shutdown(wait=False)
+
+
 class PDFParser:
     """Parse PDF documents and extract text/images."""
     
-    def __init__(self, dpi: int = 200):
+    def __init__(
+        self,
+        dpi: int = 200,
+        max_workers: int | None = None,
+        min_pages_per_worker: int = 8,
+        grayscale: bool = True,
+        min_embedded_image_pixels: int = 64 * 64,
+    ):
         """Initialize PDF parser.
         
         Args:
             dpi: Resolution for page rendering (higher = better OCR, slower).
+            max_workers: Maximum render processes (defaults to CPU count).
+                The render pool is shared process-wide and sized by the
+                first parser to use it.
+            min_pages_per_worker: Minimum pages each render process must get;
+                smaller documents are rendered in-process. Shipping rendered
+                pages back from a worker costs about as much as rendering a
+                text page, so only long documents gain from the pool.
+            grayscale: Render pages as grayscale, which is all OCR needs and
+                a third of the data of RGB.
+            min_embedded_image_pixels: Embedded images with fewer pixels
+                (icons, bullets) are skipped.
         """
         self.dpi = dpi
         self.zoom = dpi / 72  # PDF default is 72 DPI
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_pages_per_worker = max(1, min_pages_per_worker)
+        self.grayscale = grayscale
+        self.min_embedded_image_pixels = min_embedded_image_pixels
     
     def parse(self, document: LoadedDocument) -> list[PDFPage]:
         """Parse PDF and extract pages as text and images.
         
+        Documents with enough pages are rendered in the shared process pool,
+        each worker opening its own copy of the PDF and rendering a
+        contiguous range of pages.
+        
         Args:
             document: LoadedDocument containing PDF bytes.
             
         Returns:
             List of PDFPage objects.
         """
-        pages = []
+        with self._open(document) as pdf_doc:
+            return list(self._iter_pages(pdf_doc, document))
+    
+    def iter_pages(self, document: LoadedDocument) -> Iterator[PDFPage]:
+        """Parse PDF pages, yielding each as soon as it is rendered.
         
-        # Open PDF from bytes
-        pdf_doc = fitz.open(stream=document.content, filetype="pdf")
+        Lets callers start on the first pages (e.g. enhancing them for OCR)
+        while later ones are still rendering.
         
-        try:
-            for page_num in range(len(pdf_doc)):
-                page = pdf_doc[page_num]
-                
-                # Extract text
-                text = page.get_text("text")
-                
-                # Render page to image
-                matrix = fitz.Matrix(self.zoom, self.zoom)
-                pixmap = page.get_pixmap(matrix=matrix)
-                
-                # Convert to PIL Image
-                img_data = pixmap.tobytes("png")
-                image = Image.open(io.BytesIO(img_data))
-                
-                pages.append(PDFPage(
-                    page_number=page_num + 1,
-                    text=text,
-                    image=image,
-                    width=page.rect.width,
-                    height=page.rect.height,
-                ))
-        finally:
-            pdf_doc.close()
-        
-        return pages
+        Args:
+            document: LoadedDocument containing PDF bytes.
+            
+        Yields:
+            PDFPage for each page, in order.
+        """
+        with self._open(document) as pdf_doc:
+            yield from self._iter_pages(pdf_doc, document)
+    
+    def parse_all(
+        self,
+        document: LoadedDocument,
+    ) -> tuple[list[PDFPage], list[Image.Image], dict]:
+        """Parse pages, embedded images and metadata, opening the PDF once.
+        
+        Args:
+            document: LoadedDocument containing PDF bytes.
+            
+        Returns:
+            Tuple of (pages, embedded images, metadata).
+        """
+        with self._open(document) as pdf_doc:
+            pages = list(self._iter_pages(pdf_doc, document))
+            images = self._decode_images(self._extract_image_bytes(pdf_doc))
+            metadata = self._read_metadata(pdf_doc)
+        
+        return pages, images, metadata
     
     def extract_embedded_images(self, document: LoadedDocument) -> list[Image.Image]:
         """Extract embedded images from PDF.
@@ -82,29 +214,23 @@ class PDFParser:
         Returns:
             List of PIL Images.
         """
-        images = []
-        pdf_doc = fitz.open(stream=document.content, filetype="pdf")
+        return self._decode_images(self.extract_embedded_image_bytes(document))
+    
+    def extract_embedded_image_bytes(self, document: LoadedDocument) -> list[tuple[bytes, str]]:
+        """Extract the encoded bytes of each distinct embedded image.
         
-        try:
-            for page_num in range(len(pdf_doc)):
-                page = pdf_doc[page_num]
-                image_list = page.get_images(full=True)
-                
-                for img_index, img_info in enumerate(image_list):
-                    xref = img_info[0]
-                    base_image = pdf_doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    
-                    try:
-                        image = Image.open(io.BytesIO(image_bytes))
-                        images.append(image)
-                    except Exception:
-                        # Skip invalid images
-                        continue
-        finally:
-            pdf_doc.close()
+        Images referenced from several pages (logos, letterheads) share an
+        xref and are extracted once; images smaller than
+        ``min_embedded_image_pixels`` are skipped.
         
-        return images
+        Args:
+            document: LoadedDocument containing PDF bytes.
+            
+        Returns:
+            List of (image bytes, file extension) tuples.
+        """
+        with self._open(document) as pdf_doc:
+            return self._extract_image_bytes(pdf_doc)
     
     def get_metadata(self, document: LoadedDocument) -> dict:
         """Extract PDF metadata.
@@ -115,11 +241,74 @@ class PDFParser:
         Returns:
             Dictionary of metadata.
         """
-        pdf_doc = fitz.open(stream=document.content, filetype="pdf")
+        with self._open(document) as pdf_doc:
+            return self._read_metadata(pdf_doc)
+    
+    def _open(self, document: LoadedDocument) -> fitz.Document:
+        """Open the PDF bytes; use as a context manager to close it."""
+        return fitz.open(stream=document.content, filetype="pdf")
+    
+    def _iter_pages(self, pdf_doc: fitz.Document, document: LoadedDocument) -> Iterator[PDFPage]:
+        """Render every page of an open PDF, in-process or across the pool."""
+        page_count = len(pdf_doc)
+        workers = min(self.max_workers, page_count // self.min_pages_per_worker)
+        # Daemonic processes (e.g. Celery prefork workers) cannot spawn children
+        if workers < 2 or multiprocessing.current_process().daemon:
+            yield from _iter_rendered_pages(pdf_doc, range(page_count), self.zoom, self.grayscale)
+            return
         
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        pool = _get_render_pool(self.max_workers)
         try:
-            metadata = pdf_doc.metadata or {}
-            metadata["page_count"] = len(pdf_doc)
-            return metadata
-        finally:
-            pdf_doc.close()
+            futures = [
+                pool.submit(
+                    _render_page_range,
+                    document.content, start, stop, self.zoom, self.grayscale,
+                )
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+            # Hand over each range as soon as it (and those before it) is done
+            for future in futures:
+                yield from future.result()
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); fail this document only
+            _discard_render_pool(pool)
+            raise
+    
+    def _extract_image_bytes(self, pdf_doc: fitz.Document) -> list[tuple[bytes, str]]:
+        """Collect distinct, non-icon embedded images from an open PDF."""
+        images = []
+        seen_xrefs: set[int] = set()
+        
+        for page_num in range(len(pdf_doc)):
+            for img_info in pdf_doc.get_page_images(page_num, full=True):
+                xref, _, width, height = img_info[:4]
+                if xref in seen_xrefs:
+                    continue
+                seen_xrefs.add(xref)
+                if width * height < self.min_embedded_image_pixels:
+                    continue
+                
+                base_image = pdf_doc.extract_image(xref)
+                if base_image:
+                    images.append((base_image["image"], base_image["ext"]))
+        
+        return images
+    
+    def _decode_images(self, image_bytes: list[tuple[bytes, str]]) -> list[Image.Image]:
+        """Open encoded images lazily with PIL, skipping invalid ones."""
+        images = []
+        for data, _ in image_bytes:
+            try:
+                images.append(Image.open(io.BytesIO(data)))
+            except Exception:
+                # Skip invalid images
+                continue
+        
+        return images
+    
+    def _read_metadata(self, pdf_doc: fitz.Document) -> dict:
+        """Read document metadata and page count from an open PDF."""
+        metadata = pdf_doc.metadata or {}
+        metadata["page_count"] = len(pdf_doc)
+        return metadata
@@ -1,13 +1,18 @@
 """FastAPI application for document extraction."""
 
+import asyncio
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 from uuid import uuid4
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Query
+import httpx
+import ollama
+from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .config import get_settings
 from .processor import DocumentProcessor
@@ -17,13 +22,21 @@ from .output.schemas import (
     HealthResponse,
     DocumentTypeEnum,
     DocumentStatus,
+    ExtractionError,
 )
 
+# Size of each read from an uploaded file
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# How long a health probe's Ollama check result is reused, in seconds
+OLLAMA_HEALTH_TTL = 5.0
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Document Extractor API",
     description="AI-powered document extraction for college admissions",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -47,6 +60,24 @@ def get_processor() -> DocumentProcessor:
     return _processor
 
 
+async def read_upload(file: UploadFile, max_bytes: int) -> bytearray | None:
+    """Read an uploaded file in chunks, stopping once it exceeds ``max_bytes``.
+    
+    Args:
+        file: Uploaded file.
+        max_bytes: Maximum allowed size in bytes.
+        
+    Returns:
+        File content, or None if the file is larger than ``max_bytes``.
+    """
+    content = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        content += chunk
+        if len(content) > max_bytes:
+            return None
+    return content
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize on startup."""
@@ -54,21 +85,46 @@ async def startup_event():
     
     # Create upload directory
     settings.upload_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Shared HTTP client so URL downloads reuse pooled connections
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release resources on shutdown."""
+    await app.state.http.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_ollama_client() -> ollama.Client:
+    """Get a shared Ollama client for health checks."""
+    return ollama.Client(host=get_settings().ollama_host)
+
+
+# (monotonic time of last check, whether Ollama responded)
+_ollama_last_check: tuple[float, bool] = (float("-inf"), False)
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    import ollama
+    global _ollama_last_check
     
-    ollama_available = False
-    try:
-        settings = get_settings()
-        client = ollama.Client(host=settings.ollama_host)
-        client.list()
-        ollama_available = True
-    except Exception:
-        pass
+    checked_at, ollama_available = _ollama_last_check
+    now = time.monotonic()
+    if now - checked_at >= OLLAMA_HEALTH_TTL:
+        try:
+            await asyncio.to_thread(get_ollama_client().list)
+            ollama_available = True
+        except Exception:
+            ollama_available = False
+        _ollama_last_check = (now, ollama_available)
     
     return HealthResponse(
         status="healthy",
@@ -96,21 +152,22 @@ async def extract_document(
         raise HTTPException(status_code=400, detail="Filename required")
     
     # Read file content
-    content = await file.read()
-    
-    if len(content) == 0:
-        raise HTTPException(status_code=400, detail="Empty file")
-    
     settings = get_settings()
-    if len(content) > settings.max_file_size_bytes:
+    content = await read_upload(file, settings.max_file_size_bytes)
+    
+    if content is None:
         raise HTTPException(
             status_code=413, 
             detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB"
         )
     
-    # Process document
+    if len(content) == 0:
+        raise HTTPException(status_code=400, detail="Empty file")
+    
+    # Process document off the event loop
     processor = get_processor()
-    result = processor.process_file(
+    result = await asyncio.to_thread(
+        processor.process_file,
         content=content,
         filename=file.filename,
         document_type_hint=document_type,
@@ -138,20 +195,69 @@ async def extract_batch(
         )
     
     batch_id = str(uuid4())
+    settings = get_settings()
     processor = get_processor()
-    results = []
+    # Bound how many files are held in memory and processed at once
+    semaphore = asyncio.Semaphore(os.cpu_count() or 4)
     
-    for file in files:
-        if not file.filename:
-            continue
-            
-        content = await file.read()
-        if content:
-            result = processor.process_file(
-                content=content,
+    async def process_content(
+        file: UploadFile,
+        content: bytearray | None,
+        image=None,
+    ) -> ExtractionResponse | None:
+        if content is None:
+            return ExtractionResponse(
+                document_id=str(uuid4()),
+                status=DocumentStatus.FAILED,
+                document_type=DocumentTypeEnum.UNKNOWN,
                 filename=file.filename,
+                overall_confidence=0.0,
+                errors=[ExtractionError(
+                    code="FILE_TOO_LARGE",
+                    message=f"File exceeds maximum size of {settings.max_file_size_mb}MB",
+                    suggested_action="Upload a smaller file",
+                )],
             )
-            results.append(result.response)
+        if not content:
+            return None
+        
+        result = await asyncio.to_thread(
+            processor.process_file,
+            content=content,
+            filename=file.filename,
+            image=image,
+        )
+        return result.response
+    
+    async def process_upload(file: UploadFile) -> ExtractionResponse | None:
+        async with semaphore:
+            content = await read_upload(file, settings.max_file_size_bytes)
+            return await process_content(file, content)
+    
+    uploads = [file for file in files if file.filename]
+    
+    if processor.gpu_decode:
+        # Read the whole batch first so its JPEGs are decoded on the GPU together
+        async def read(file: UploadFile) -> bytearray | None:
+            async with semaphore:
+                return await read_upload(file, settings.max_file_size_bytes)
+        
+        async def process_decoded(file, content, image) -> ExtractionResponse | None:
+            async with semaphore:
+                return await process_content(file, content, image)
+        
+        contents = await asyncio.gather(*(read(file) for file in uploads))
+        images = await asyncio.to_thread(
+            processor.decode_images,
+            [(content or b"", file.filename) for file, content in zip(uploads, contents)],
+        )
+        responses = await asyncio.gather(*(
+            process_decoded(file, content, image)
+            for file, content, image in zip(uploads, contents, images)
+        ))
+    else:
+        responses = await asyncio.gather(*(process_upload(file) for file in uploads))
+    results = [response for response in responses if response is not None]
     
     return BatchExtractionResponse(
         batch_id=batch_id,
@@ -163,6 +269,7 @@ async def extract_batch(
 
 @app.post("/extract/url")
 async def extract_from_url(
+    request: Request,
     url: str,
     document_type: DocumentTypeEnum | None = None,
 ):
@@ -170,13 +277,28 @@ async def extract_from_url(
     
     Downloads and processes the document from the given URL.
     """
-    import httpx
+    settings = get_settings()
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB",
+    )
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True)
+        async with request.app.state.http.stream("GET", url) as response:
             response.raise_for_status()
-            content = response.content
+            
+            # Reject on the declared size before downloading anything
+            declared_size = int(response.headers.get("content-length") or 0)
+            if declared_size > settings.max_file_size_bytes:
+                raise too_large
+            
+            content = bytearray()
+            async for chunk in response.aiter_bytes(UPLOAD_CHUNK_SIZE):
+                content += chunk
+                if len(content) > settings.max_file_size_bytes:
+                    raise too_large
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to download: {str(e)}")
     
@@ -184,7 +306,8 @@ async def extract_from_url(
     filename = url.split("/")[-1].split("?")[0] or "document"
     
     processor = get_processor()
-    result = processor.process_file(
+    result = await asyncio.to_thread(
+        processor.process_file,
         content=content,
         filename=filename,
         document_type_hint=document_type,
@@ -221,7 +344,7 @@ async def list_templates():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -1,9 +1,11 @@
 """Database models for PostgreSQL with SQLAlchemy."""
 
 from datetime import datetime
+from functools import lru_cache
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Boolean, Text
+import orjson
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Boolean, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
@@ -17,6 +19,10 @@ class Document(Base):
     """Document record in database."""
     
     __tablename__ = "documents"
+    __table_args__ = (
+        # Supports containment queries on extracted fields
+        Index("ix_documents_extracted_data", "extracted_data", postgresql_using="gin"),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     filename = Column(String(255), nullable=False)
@@ -25,8 +31,8 @@ class Document(Base):
     status = Column(String(50), nullable=False, default="pending")
     
     # JSONB columns for flexible data storage
-    extracted_data = Column(JSONB, nullable=False, default={})
-    confidences = Column(JSONB, nullable=False, default={})
+    extracted_data = Column(JSONB, nullable=False, default=dict)
+    confidences = Column(JSONB, nullable=False, default=dict)
     overall_confidence = Column(Float, default=0.0)
     
     # Raw data for debugging/reprocessing
@@ -34,7 +40,7 @@ class Document(Base):
     raw_llm_response = Column(Text, nullable=True)
     
     # Error tracking
-    errors = Column(JSONB, nullable=False, default=[])
+    errors = Column(JSONB, nullable=False, default=list)
     requires_review = Column(Boolean, default=False)
     
     # Processing metadata
@@ -60,21 +66,36 @@ class ExtractionJob(Base):
     callback_url = Column(String(500), nullable=True)
     
     # Store document IDs
-    document_ids = Column(JSONB, nullable=False, default=[])
+    document_ids = Column(JSONB, nullable=False, default=list)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
 
 
+def _json_dumps(value) -> str:
+    """Serialize JSONB values with orjson."""
+    return orjson.dumps(value).decode()
+
+
 # Database connection
+@lru_cache(maxsize=1)
 def get_engine():
-    """Get async database engine."""
+    """Get the shared async database engine and its connection pool."""
     settings = get_settings()
-    return create_async_engine(settings.database_url, echo=False)
+    return create_async_engine(
+        settings.database_url,
+        echo=False,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_pre_ping=True,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_session_maker():
-    """Get async session maker."""
+    """Get cached async session maker."""
     engine = get_engine()
     return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
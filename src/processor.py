@@ -1,19 +1,30 @@
 """Core document processing pipeline."""
 
+import asyncio
+import os
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from statistics import fmean
 from uuid import uuid4
 
 from PIL import Image
 
 from .ingestion.loader import DocumentLoader, DocumentType, LoadedDocument
 from .ingestion.pdf_parser import PDFParser
-from .ingestion.image_parser import ImageParser
+from .ingestion.image_parser import GPUImageParser, ImageParser
 from .ingestion.docx_parser import DocxParser
 from .preprocessing.enhancer import ImageEnhancer
 from .extraction.ocr_engine import OCRPipeline, OCRResult
 from .extraction.llm_extractor import LLMPipeline, ExtractionResult
-from .templates.base_template import BaseTemplate, DocumentCategory, TemplateResult
+from .templates.base_template import (
+    BaseTemplate,
+    DocumentCategory,
+    TemplateResult,
+    get_keyword_matcher,
+)
 from .templates.transcript import TranscriptTemplate
 from .templates.id_document import IDDocumentTemplate
 from .templates.certificate import CertificateTemplate
@@ -33,6 +44,23 @@ from .output.schemas import (
 from .config import get_settings
 
 
+@dataclass(slots=True)
+class _PreparedDocument:
+    """A document loaded, OCR'd and classified, awaiting LLM extraction."""
+    
+    document_id: str
+    filename: str
+    start_time: float
+    text: str
+    template: BaseTemplate
+    ocr_result: OCRResult | None
+    
+    @property
+    def llm_request(self) -> tuple[str, str, tuple[str, ...]]:
+        """The (text, document_type, expected_fields) to extract with."""
+        return self.text, self.template.category.value, self.template.field_names
+
+
 @dataclass
 class ProcessingResult:
     """Complete result from document processing."""
@@ -55,9 +83,13 @@ class DocumentProcessor:
         # Initialize components
         self.loader = DocumentLoader(max_file_size_bytes=settings.max_file_size_bytes)
         self.pdf_parser = PDFParser()
-        self.image_parser = ImageParser()
+        # Batch GPU JPEG decoding, when enabled and supported
+        self.gpu_decode = settings.enable_gpu_decode and GPUImageParser.is_available()
+        self.image_parser = GPUImageParser() if self.gpu_decode else ImageParser()
         self.docx_parser = DocxParser()
-        self.enhancer = ImageEnhancer()
+        self.enhancer = ImageEnhancer(
+            use_cuda=settings.enable_gpu_preprocessing and ImageEnhancer.is_cuda_available()
+        )
         self.ocr_pipeline = OCRPipeline(
             confidence_threshold=settings.confidence_threshold
         )
@@ -79,7 +111,30 @@ class DocumentProcessor:
             CertificateTemplate(),
         ]
         
+        # Template for each document type hint; the first template of a
+        # category wins, as several share ID_DOCUMENT
+        self.templates_by_type: dict[str, BaseTemplate] = {}
+        for template in self.templates:
+            self.templates_by_type.setdefault(template.category.value, template)
+        
+        # One scan of the text finds the keywords of every template
+        self.keyword_matcher = get_keyword_matcher(tuple(
+            kw for template in self.templates for kw in template.classification_keywords
+        ))
+        
         self.confidence_threshold = settings.confidence_threshold
+        # Pages with less embedded text than this are OCR'd
+        self.min_page_text_chars = 50
+        # Enhances pages for OCR; shared by all documents in flight, so
+        # concurrent callers don't each start a CPU-sized pool
+        self._enhance_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="enhance",
+        )
+        
+        # Event loop for batched LLM calls from synchronous callers
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
     
     def process_file(
         self, 
@@ -87,6 +142,8 @@ class DocumentProcessor:
         content: bytes | None = None,
         filename: str = "document",
         document_type_hint: DocumentTypeEnum | None = None,
+        image: Image.Image | None = None,
+        progress: Callable[[str, float], None] | None = None,
     ) -> ProcessingResult:
         """Process a single document file.
         
@@ -95,6 +152,11 @@ class DocumentProcessor:
             content: File content as bytes.
             filename: Original filename.
             document_type_hint: Optional hint for document type.
+            image: Already decoded image for image documents (see
+                ``decode_images``); skips parsing the content again.
+            progress: Optional callback, called with a description of each
+                processing stage and the approximate fraction done as the
+                stage starts. Runs on the calling thread.
             
         Returns:
             ProcessingResult with extraction data.
@@ -103,132 +165,298 @@ class DocumentProcessor:
         document_id = str(uuid4())
         
         try:
-            # Load document
-            if file_path:
-                from pathlib import Path
-                document = self.loader.load_from_path(Path(file_path))
-            elif content:
-                document = self.loader.load_from_bytes(content, filename)
-            else:
-                raise ValueError("Either file_path or content must be provided")
-            
-            # Extract text based on document type
-            text, images = self._extract_content(document)
-            
-            # Run OCR on images if needed
-            ocr_result = None
-            if images and (not text or len(text.strip()) < 100):
-                ocr_result = self._run_ocr(images)
-                text = ocr_result.full_text if ocr_result else text
-            
-            # Classify document type
-            template = self._classify_document(text, document_type_hint)
-            
-            # Extract fields using LLM
-            llm_result = self.llm_pipeline.extract(
-                text=text,
-                document_type=template.category.value,
-                expected_fields=template.field_names,
+            prepared = self._prepare(
+                document_id, start_time, file_path, content, filename,
+                document_type_hint, image, progress,
             )
             
-            # Build response
-            response = self._build_response(
-                document_id=document_id,
-                filename=filename,
-                template=template,
-                llm_result=llm_result,
-                ocr_result=ocr_result,
-            )
-            
-            processing_time = int((time.time() - start_time) * 1000)
-            response.processing_time_ms = processing_time
+            # Extract fields using LLM
+            if progress:
+                progress("Extracting fields", 0.6)
+            llm_result = self.llm_pipeline.extract(*prepared.llm_request)
             
-            return ProcessingResult(
-                document_id=document_id,
-                success=True,
-                response=response,
-                ocr_text=text,
-                raw_llm_response=llm_result.raw_response,
-                processing_time_ms=processing_time,
-            )
+            if progress:
+                progress("Validating fields", 0.9)
+            return self._finish(prepared, llm_result)
             
         except Exception as e:
-            processing_time = int((time.time() - start_time) * 1000)
+            return self._failed(document_id, filename, start_time, e)
+    
+    def process_files(
+        self,
+        files: list[tuple[bytes, str]],
+        progress: Callable[[int, int], None] | None = None,
+    ) -> list[ProcessingResult]:
+        """Process several documents with a single batched LLM call.
+        
+        Each document is loaded, OCR'd and classified in turn; their LLM
+        requests then go out together through ``LLMPipeline.extract_batch``,
+        so the server can batch them instead of serving one at a time.
+        
+        Args:
+            files: (content, filename) pairs.
+            progress: Optional callback, called with (documents prepared,
+                total) after each document is ready for extraction.
             
-            response = ExtractionResponse(
-                document_id=document_id,
-                status=DocumentStatus.FAILED,
-                document_type=DocumentTypeEnum.UNKNOWN,
-                filename=filename,
-                overall_confidence=0.0,
-                errors=[ExtractionError(
-                    code="PROCESSING_ERROR",
-                    message=str(e),
-                    suggested_action="Check file format and try again",
-                )],
-                processing_time_ms=processing_time,
+        Returns:
+            ProcessingResult per file, in order.
+        """
+        results: list[ProcessingResult | None] = [None] * len(files)
+        prepared: list[_PreparedDocument] = []
+        
+        for i, (content, filename) in enumerate(files):
+            start_time = time.time()
+            document_id = str(uuid4())
+            try:
+                prepared.append(self._prepare(
+                    document_id, start_time, content=content, filename=filename,
+                ))
+            except Exception as e:
+                results[i] = self._failed(document_id, filename, start_time, e)
+            if progress:
+                progress(i + 1, len(files))
+        
+        if prepared:
+            llm_results = self._run_async(
+                self.llm_pipeline.extract_batch([doc.llm_request for doc in prepared])
             )
             
-            return ProcessingResult(
-                document_id=document_id,
-                success=False,
-                response=response,
-                processing_time_ms=processing_time,
-            )
+            pending = zip(prepared, llm_results)
+            for i, result in enumerate(results):
+                if result is None:
+                    doc, llm_result = next(pending)
+                    try:
+                        results[i] = self._finish(doc, llm_result)
+                    except Exception as e:
+                        results[i] = self._failed(
+                            doc.document_id, doc.filename, doc.start_time, e
+                        )
+        
+        return results
+    
+    def _prepare(
+        self,
+        document_id: str,
+        start_time: float,
+        file_path: str | None = None,
+        content: bytes | None = None,
+        filename: str = "document",
+        document_type_hint: DocumentTypeEnum | None = None,
+        image: Image.Image | None = None,
+        progress: Callable[[str, float], None] | None = None,
+    ) -> _PreparedDocument:
+        """Load, OCR and classify a document, up to the LLM call."""
+        # Load document
+        if progress:
+            progress("Loading document", 0.0)
+        if file_path:
+            from pathlib import Path
+            document = self.loader.load_from_path(Path(file_path))
+        elif content:
+            document = self.loader.load_from_bytes(content, filename)
+        else:
+            raise ValueError("Either file_path or content must be provided")
+        
+        if image is not None and document.document_type == DocumentType.IMAGE:
+            document.images = [image]
+        
+        if progress:
+            progress("Reading text", 0.1)
+        # Extract text based on document type, one entry per page; pages
+        # without enough digital text are enhanced for OCR as they arrive
+        page_texts, ocr_pages, enhanced = self._extract_content(document)
+        ocr_result = None
+        if ocr_pages:
+            # Run OCR on all pages together so the engine can batch them
+            page_results = self.ocr_pipeline.process_many(enhanced)
+            for i, page_result in zip(ocr_pages, page_results):
+                page_texts[i] = page_result.full_text
+            ocr_result = self._combine_ocr_results(page_results)
+        
+        text = "\n\n".join(page_texts)
+        
+        # Classify document type
+        if progress:
+            progress("Classifying document", 0.5)
+        template = self._classify_document(text, document_type_hint)
+        
+        return _PreparedDocument(
+            document_id=document_id,
+            filename=filename,
+            start_time=start_time,
+            text=text,
+            template=template,
+            ocr_result=ocr_result,
+        )
+    
+    def _finish(
+        self,
+        prepared: _PreparedDocument,
+        llm_result: ExtractionResult,
+    ) -> ProcessingResult:
+        """Build the ProcessingResult for a prepared document."""
+        # Build response
+        response = self._build_response(
+            document_id=prepared.document_id,
+            filename=prepared.filename,
+            template=prepared.template,
+            llm_result=llm_result,
+            ocr_result=prepared.ocr_result,
+        )
+        
+        processing_time = int((time.time() - prepared.start_time) * 1000)
+        response.processing_time_ms = processing_time
+        
+        return ProcessingResult(
+            document_id=prepared.document_id,
+            success=True,
+            response=response,
+            ocr_text=prepared.text,
+            raw_llm_response=llm_result.raw_response,
+            processing_time_ms=processing_time,
+        )
+    
+    def _failed(
+        self,
+        document_id: str,
+        filename: str,
+        start_time: float,
+        error: Exception,
+    ) -> ProcessingResult:
+        """Build the ProcessingResult for a document that raised."""
+        processing_time = int((time.time() - start_time) * 1000)
+        
+        response = ExtractionResponse(
+            document_id=document_id,
+            status=DocumentStatus.FAILED,
+            document_type=DocumentTypeEnum.UNKNOWN,
+            filename=filename,
+            overall_confidence=0.0,
+            errors=[ExtractionError(
+                code="PROCESSING_ERROR",
+                message=str(error),
+                suggested_action="Check file format and try again",
+            )],
+            processing_time_ms=processing_time,
+        )
+        
+        return ProcessingResult(
+            document_id=document_id,
+            success=False,
+            response=response,
+            processing_time_ms=processing_time,
+        )
+    
+    def _run_async(self, coro):
+        """Run a coroutine to completion on the processor's event loop.
+        
+        The loop outlives each call, so connections pooled by the async LLM
+        clients stay bound to a live loop between batches.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+    
+    def decode_images(self, files: list[tuple[bytes, str]]) -> list[Image.Image | None]:
+        """Decode the image files of a batch together.
+        
+        With GPU decoding enabled, the batch's JPEGs are decoded in a single
+        GPU call; the results can be passed to ``process_file`` as ``image``.
+        
+        Args:
+            files: (content, filename) pairs.
+            
+        Returns:
+            Decoded image per file, or None for files that aren't valid
+            images (or when GPU decoding is off).
+        """
+        decoded: list[Image.Image | None] = [None] * len(files)
+        if not self.gpu_decode:
+            return decoded
+        
+        indices, documents = [], []
+        for i, (content, filename) in enumerate(files):
+            try:
+                document = self.loader.load_from_bytes(content, filename)
+            except Exception:
+                continue
+            if document.document_type == DocumentType.IMAGE:
+                indices.append(i)
+                documents.append(document)
+        
+        try:
+            infos = self.image_parser.parse_many(documents)
+        except Exception:
+            # process_file parses and reports errors per document
+            return decoded
+        
+        for i, info in zip(indices, infos):
+            decoded[i] = info.image
+        return decoded
     
     def _extract_content(
         self, 
         document: LoadedDocument
-    ) -> tuple[str, list[Image.Image]]:
-        """Extract text and images from document.
+    ) -> tuple[list[str], list[int], list[Image.Image]]:
+        """Extract text from document, enhancing the pages that need OCR.
+        
+        Pages are consumed as the parser produces them: a page lacking
+        digital text goes to the processor's enhancement pool straight
+        away, so PDF rendering overlaps with enhancing earlier pages
+        (OpenCV releases the GIL), and text-native page images are dropped
+        immediately.
         
         Returns:
-            Tuple of (text, list of images).
+            Tuple of (text per page, indices of pages to OCR, enhanced
+            image per page to OCR).
         """
-        text = ""
-        images = []
+        page_texts = []
+        ocr_pages = []
+        futures = []
+        
+        try:
+            for i, (text, image) in enumerate(self._iter_content(document)):
+                page_texts.append(text)
+                if image is not None and len(text.strip()) < self.min_page_text_chars:
+                    ocr_pages.append(i)
+                    futures.append(self._enhance_pool.submit(self.enhancer.enhance, image))
+            
+            enhanced = [future.result() for future in futures]
+        except BaseException:
+            # Don't leave this document's queued pages to the shared pool
+            for future in futures:
+                future.cancel()
+            raise
         
+        return page_texts, ocr_pages, enhanced
+    
+    def _iter_content(
+        self,
+        document: LoadedDocument,
+    ) -> Iterator[tuple[str, Image.Image | None]]:
+        """Yield (text, image) per page; image is None for text-only formats."""
         if document.document_type == DocumentType.PDF:
-            pages = self.pdf_parser.parse(document)
-            text = "\n\n".join(p.text for p in pages)
-            images = [p.image for p in pages]
+            for page in self.pdf_parser.iter_pages(document):
+                yield page.text, page.image
             
         elif document.document_type == DocumentType.IMAGE:
-            img_info = self.image_parser.parse(document)
-            images = [img_info.image]
+            for image in document.images or [self.image_parser.parse(document).image]:
+                yield "", image
             
         elif document.document_type == DocumentType.DOCX:
-            docx_content = self.docx_parser.parse(document)
-            text = docx_content.full_text
-        
-        return text, images
+            yield self.docx_parser.parse(document).full_text, None
     
-    def _run_ocr(self, images: list[Image.Image]) -> OCRResult | None:
-        """Run OCR on images.
+    def _combine_ocr_results(self, results: list[OCRResult]) -> OCRResult:
+        """Combine per-page OCR results.
         
         Returns:
             Combined OCR result.
         """
-        if not images:
-            return None
-        
-        all_text = []
-        total_confidence = 0
-        
-        for image in images:
-            # Enhance image first
-            enhanced = self.enhancer.enhance(image)
-            
-            # Run OCR
-            result = self.ocr_pipeline.process(enhanced)
-            all_text.append(result.full_text)
-            total_confidence += result.confidence
-        
-        from .extraction.ocr_engine import OCRResult
         return OCRResult(
-            full_text="\n\n".join(all_text),
+            full_text="\n\n".join([result.full_text for result in results]),
             words=[],
-            confidence=total_confidence / len(images) if images else 0,
+            confidence=fmean([result.confidence for result in results]) if results else 0,
             engine_used="pipeline",
         )
     
@@ -248,19 +476,23 @@ class DocumentProcessor:
         """
         # If hint provided, use corresponding template
         if type_hint:
-            for template in self.templates:
-                if template.category.value == type_hint.value:
-                    return template
+            template = self.templates_by_type.get(type_hint.value)
+            if template is not None:
+                return template
         
         # Otherwise, classify based on content
         best_template = self.templates[0]
         best_score = 0
         
+        found_keywords = self.keyword_matcher.find(text)
         for template in self.templates:
-            score = template.classify(text)
+            score = template.classify(text, found_keywords)
             if score > best_score:
                 best_score = score
                 best_template = template
+                # Nothing later can beat a perfect score
+                if best_score >= 1.0:
+                    break
         
         return best_template
     
@@ -1,5 +1,11 @@
 """Celery tasks for background document processing."""
 
+import hashlib
+from functools import lru_cache
+from uuid import uuid4
+
+import orjson
+import redis
 from celery import Celery
 from celery.result import AsyncResult
 
@@ -27,6 +33,15 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,  # Process one task at a time for heavy workloads
 )
 
+# Uploaded bytes live in Redis under their own key rather than in the task
+# message, so the broker only carries the key
+PAYLOAD_KEY_PREFIX = "doc:"
+PAYLOAD_TTL_SECONDS = 3600
+
+# Batch results are cached by content hash so duplicate uploads reuse them
+RESULT_KEY_PREFIX = "result:"
+RESULT_TTL_SECONDS = 3600
+
 # Global processor (initialized per worker)
 _processor = None
 
@@ -39,28 +54,137 @@ def get_processor():
     return _processor
 
 
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """Get the shared Redis client for document payloads."""
+    return redis.Redis.from_url(settings.redis_url)
+
+
+def store_payloads(contents: list[bytes]) -> list[str]:
+    """Store raw file contents in Redis for workers to fetch.
+    
+    Args:
+        contents: File contents.
+        
+    Returns:
+        Payload key for each content, in order.
+    """
+    keys = [f"{PAYLOAD_KEY_PREFIX}{uuid4()}" for _ in contents]
+    pipe = get_redis().pipeline(transaction=False)
+    for key, content in zip(keys, contents):
+        pipe.set(key, bytes(content), ex=PAYLOAD_TTL_SECONDS)
+    pipe.execute()
+    return keys
+
+
+def load_payload(payload_key: str) -> bytes:
+    """Fetch and delete a stored file content.
+    
+    Args:
+        payload_key: Key returned by store_payloads.
+        
+    Returns:
+        Raw file content.
+        
+    Raises:
+        KeyError: If the payload expired or was already consumed.
+    """
+    content = get_redis().getdel(payload_key)
+    if content is None:
+        raise KeyError(f"Document payload {payload_key!r} not found or expired")
+    return content
+
+
+def enqueue_document(
+    content: bytes,
+    filename: str,
+    document_type: str | None = None,
+) -> AsyncResult:
+    """Store a document's bytes and queue it for processing.
+    
+    Args:
+        content: Raw file content.
+        filename: Original filename.
+        document_type: Optional document type hint.
+        
+    Returns:
+        AsyncResult of the queued task.
+    """
+    [payload_key] = store_payloads([content])
+    return process_document_task.delay(payload_key, filename, document_type)
+
+
+def enqueue_batch(
+    files: list[tuple[bytes, str]],
+    callback_url: str | None = None,
+) -> AsyncResult:
+    """Store a batch of documents' bytes and queue them for processing.
+    
+    Args:
+        files: List of (content, filename) tuples.
+        callback_url: Optional URL to POST results.
+        
+    Returns:
+        AsyncResult of the queued task.
+    """
+    keys = store_payloads([content for content, _ in files])
+    documents = [
+        {"payload_key": key, "filename": filename}
+        for key, (_, filename) in zip(keys, files)
+    ]
+    return process_batch_task.delay(documents, callback_url)
+
+
+def _content_digest(content: bytes) -> str:
+    """Hash file content to spot duplicate uploads."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _get_cached_results(digests: list[str]) -> dict[str, dict]:
+    """Look up cached extraction results by content digest."""
+    if not digests:
+        return {}
+    
+    values = get_redis().mget([f"{RESULT_KEY_PREFIX}{digest}" for digest in digests])
+    return {
+        digest: orjson.loads(value)
+        for digest, value in zip(digests, values)
+        if value is not None
+    }
+
+
+def _cache_results(results: dict[str, dict]) -> None:
+    """Cache successful extraction results by content digest."""
+    if not results:
+        return
+    
+    pipe = get_redis().pipeline(transaction=False)
+    for digest, response in results.items():
+        pipe.set(f"{RESULT_KEY_PREFIX}{digest}", orjson.dumps(response), ex=RESULT_TTL_SECONDS)
+    pipe.execute()
+
+
 @celery_app.task(bind=True, name="process_document")
 def process_document_task(
     self,
-    content_base64: str,
+    payload_key: str,
     filename: str,
     document_type: str | None = None,
 ) -> dict:
     """Process a single document asynchronously.
     
     Args:
-        content_base64: Base64 encoded file content.
+        payload_key: Redis key of the file content (see enqueue_document).
         filename: Original filename.
         document_type: Optional document type hint.
         
     Returns:
         Extraction result as dictionary.
     """
-    import base64
     from .output.schemas import DocumentTypeEnum
     
-    # Decode content
-    content = base64.b64decode(content_base64)
+    # Fetch raw content
+    content = load_payload(payload_key)
     
     # Parse document type
     doc_type_hint = None
@@ -91,38 +215,69 @@ def process_batch_task(
     """Process multiple documents as a batch.
     
     Args:
-        documents: List of {"content_base64": str, "filename": str}.
+        documents: List of {"payload_key": str, "filename": str}
+            (see enqueue_batch).
         callback_url: Optional URL to POST results.
         
     Returns:
         Batch result with all extractions.
     """
-    import base64
     import httpx
     
     processor = get_processor()
-    results = []
+    results: list[dict | None] = [None] * len(documents)
     
+    # Fetch raw content; missing payloads fail on their own
+    files, indices = [], []
     for i, doc in enumerate(documents):
-        # Update progress
-        self.update_state(
-            state="PROGRESS",
-            meta={"current": i + 1, "total": len(documents)},
-        )
-        
         try:
-            content = base64.b64decode(doc["content_base64"])
-            result = processor.process_file(
-                content=content,
-                filename=doc["filename"],
-            )
-            results.append(result.response.model_dump(mode="json"))
+            files.append((load_payload(doc["payload_key"]), doc["filename"]))
+            indices.append(i)
         except Exception as e:
-            results.append({
+            results[i] = {
                 "filename": doc.get("filename", "unknown"),
                 "status": "failed",
                 "error": str(e),
-            })
+            }
+    
+    # Identical uploads (client retries, shared forms) are processed once,
+    # and reuse results from recent batches while they are cached
+    digests = [_content_digest(content) for content, _ in files]
+    unique: dict[str, int] = {}
+    for j, digest in enumerate(digests):
+        unique.setdefault(digest, j)
+    
+    cached = _get_cached_results(list(unique))
+    pending = [digest for digest in unique if digest not in cached]
+    
+    def report_progress(current: int, total: int) -> None:
+        self.update_state(
+            state="PROGRESS",
+            meta={"current": current, "total": total},
+        )
+    
+    # OCR every document, then extract all of them in one batched LLM call
+    processed = processor.process_files(
+        [files[unique[digest]] for digest in pending],
+        progress=report_progress,
+    )
+    fresh = {
+        digest: result.response.model_dump(mode="json")
+        for digest, result in zip(pending, processed)
+    }
+    _cache_results({
+        digest: fresh[digest]
+        for digest, result in zip(pending, processed)
+        if result.success
+    })
+    
+    by_digest = {**cached, **fresh}
+    for j, (i, digest) in enumerate(zip(indices, digests)):
+        response = by_digest[digest]
+        if digest in cached or unique[digest] != j:
+            # A copy of another document's result, with its own identity
+            response = {**response, "document_id": str(uuid4()), "filename": files[j][1]}
+        results[i] = response
     
     batch_result = {
         "batch_id": self.request.id,
@@ -0,0 +1,42 @@
+"""Shared normalization helpers for template post-processing."""
+
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=4096)
+def strip_title(value: str) -> str:
+    """Strip whitespace and title-case a name.
+    
+    Cached, as the same names recur across the documents of an applicant.
+    
+    Args:
+        value: Raw name.
+        
+    Returns:
+        Normalized name, as ``value.strip().title()``.
+    """
+    return value.strip().title()
+
+
+# Uppercased spellings of each gender, including Hindi (Aadhaar cards)
+_GENDERS = {
+    "M": "Male",
+    "MALE": "Male",
+    "पुरुष": "Male",
+    "F": "Female",
+    "FEMALE": "Female",
+    "महिला": "Female",
+}
+
+
+def normalize_gender(value: Any) -> Any:
+    """Map a recognized gender spelling to "Male"/"Female".
+    
+    Args:
+        value: Raw gender value.
+        
+    Returns:
+        Normalized gender, or ``value`` unchanged if not recognized.
+    """
+    return _GENDERS.get(str(value).upper().strip(), value)
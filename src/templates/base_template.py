@@ -1,8 +1,11 @@
 """Base template class for document extraction."""
 
+import unicodedata
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import Any
 
 
@@ -16,7 +19,7 @@ class DocumentCategory(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FieldDefinition:
     """Definition of an expected field."""
     
@@ -40,45 +43,102 @@ class TemplateResult:
     requires_review: bool = False
 
 
+class KeywordMatcher:
+    """Find which of a set of keywords occur in a text.
+    
+    Matches case-insensitively, like ``kw.lower() in text.lower()``, after
+    NFKC-normalizing both sides so OCR output in compatibility or
+    decomposed forms (ligatures, full-width letters, decomposed Devanagari)
+    still matches. The text is normalized and lowercased once per call;
+    each keyword is then a C-level substring search, which for a few dozen
+    keywords is several times faster than a regex alternation, whose
+    engine tries every alternative at every position.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """Prepare the keywords for matching.
+        
+        Args:
+            keywords: Keywords to look for.
+        """
+        self.keywords = frozenset(_fold(kw) for kw in keywords)
+    
+    def find(self, text: str) -> set[str]:
+        """Get the normalized, lowercased keywords present in ``text``."""
+        text = _fold(text)
+        return {kw for kw in self.keywords if kw in text}
+
+
+def _fold(text: str) -> str:
+    """NFKC-normalize and lowercase text for keyword matching."""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+@lru_cache(maxsize=None)
+def get_keyword_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    """Get the shared matcher for a set of keywords.
+    
+    Templates and processors built for the same keywords reuse one matcher
+    for the life of the process.
+    """
+    return KeywordMatcher(keywords)
+
+
 class BaseTemplate(ABC):
     """Abstract base class for document templates."""
     
     category: DocumentCategory = DocumentCategory.UNKNOWN
     
+    # Field name -> function normalizing its (non-empty) value in post_process
+    _NORMALIZERS: dict[str, Callable[[Any], Any]] = {}
+    
     @property
     @abstractmethod
-    def field_definitions(self) -> list[FieldDefinition]:
+    def field_definitions(self) -> tuple[FieldDefinition, ...]:
         """Define expected fields for this document type."""
         pass
     
-    @property
-    def field_names(self) -> list[str]:
-        """Get list of field names."""
-        return [f.name for f in self.field_definitions]
+    @cached_property
+    def field_names(self) -> tuple[str, ...]:
+        """Get field names, in definition order."""
+        return tuple(f.name for f in self.field_definitions)
     
-    @property
-    def required_fields(self) -> list[str]:
-        """Get list of required field names."""
-        return [f.name for f in self.field_definitions if f.required]
+    @cached_property
+    def required_fields(self) -> frozenset[str]:
+        """Get the set of required field names."""
+        return frozenset(f.name for f in self.field_definitions if f.required)
     
-    def classify(self, text: str) -> float:
+    def classify(self, text: str, found_keywords: set[str] | None = None) -> float:
         """Return confidence that text matches this template.
         
         Args:
             text: Document text to classify.
+            found_keywords: Keywords (as normalized by KeywordMatcher) already
+                found in ``text`` by a matcher shared across templates;
+                found with this template's own matcher if omitted.
             
         Returns:
             Confidence score 0.0-1.0.
         """
         # Default implementation using keywords
-        text_lower = text.lower()
-        matches = sum(1 for kw in self.classification_keywords if kw in text_lower)
-        return min(matches / max(len(self.classification_keywords), 1), 1.0)
+        matcher = self.keyword_matcher
+        if not matcher.keywords:
+            return 0.0
+        
+        if found_keywords is None:
+            found_keywords = matcher.find(text)
+        found = len(matcher.keywords & found_keywords)
+        return min(found / len(self.classification_keywords), 1.0)
+    
+    @cached_property
+    def keyword_matcher(self) -> "KeywordMatcher":
+        """Matcher for this template's classification keywords."""
+        return get_keyword_matcher(tuple(self.classification_keywords))
     
     @property
-    def classification_keywords(self) -> list[str]:
+    def classification_keywords(self) -> tuple[str, ...]:
         """Keywords that indicate this document type."""
-        return []
+        return ()
     
     def validate(self, fields: dict[str, Any]) -> list[str]:
         """Validate extracted fields.
@@ -113,11 +173,22 @@ class BaseTemplate(ABC):
     def post_process(self, fields: dict[str, Any]) -> dict[str, Any]:
         """Post-process extracted fields.
         
+        Runs each non-empty field with an entry in ``_NORMALIZERS`` through
+        its normalizer. ``fields`` is copied only once a field needs
+        normalizing, and returned as-is otherwise.
+        
         Args:
             fields: Raw extracted fields.
             
         Returns:
             Processed fields.
         """
-        # Default: return as-is
-        return fields
+        processed = fields
+        for name, normalize in self._NORMALIZERS.items():
+            value = fields.get(name)
+            if value:
+                if processed is fields:
+                    processed = dict(fields)
+                processed[name] = normalize(value)
+        
+        return processed
@@ -0,0 +1,59 @@
+"""Field definitions shared by several templates."""
+
+from .base_template import FieldDefinition
+
+FULL_NAME_FIELD = FieldDefinition(
+    name="full_name",
+    display_name="Full Name",
+    field_type="string",
+    required=True,
+)
+
+DOB_FIELD = FieldDefinition(
+    name="date_of_birth",
+    display_name="Date of Birth",
+    field_type="date",
+    required=True,
+)
+
+OPTIONAL_DOB_FIELD = FieldDefinition(
+    name="date_of_birth",
+    display_name="Date of Birth",
+    field_type="date",
+    required=False,
+)
+
+GENDER_FIELD = FieldDefinition(
+    name="gender",
+    display_name="Gender",
+    field_type="string",
+    required=False,
+)
+
+ADDRESS_FIELD = FieldDefinition(
+    name="address",
+    display_name="Address",
+    field_type="string",
+    required=False,
+)
+
+FATHERS_NAME_FIELD = FieldDefinition(
+    name="fathers_name",
+    display_name="Father's/Husband's Name",
+    field_type="string",
+    required=False,
+)
+
+ISSUE_DATE_FIELD = FieldDefinition(
+    name="issue_date",
+    display_name="Issue Date",
+    field_type="date",
+    required=False,
+)
+
+EXPIRY_DATE_FIELD = FieldDefinition(
+    name="expiry_date",
+    display_name="Expiry Date",
+    field_type="date",
+    required=False,
+)
@@ -1,8 +1,48 @@
 """Indian ID document templates (Aadhaar, PAN, UAN, Voter ID, Driving License)."""
 
+import re
+from functools import lru_cache
 from typing import Any
 
+from ._normalize import normalize_gender, strip_title
 from .base_template import BaseTemplate, DocumentCategory, FieldDefinition
+from .common_fields import (
+    ADDRESS_FIELD,
+    DOB_FIELD,
+    FATHERS_NAME_FIELD,
+    FULL_NAME_FIELD,
+    GENDER_FIELD,
+    OPTIONAL_DOB_FIELD,
+)
+
+# Deletes the separators OCR/LLMs leave in ID numbers, in one pass
+_STRIP_SEPARATORS = str.maketrans("", "", " -\t\u00a0")
+_AADHAAR_RE = re.compile(r"\d{12}")
+
+
+@lru_cache(maxsize=1024)
+def _format_aadhaar(digits: str) -> str:
+    """Group a 12-digit Aadhaar number as XXXX XXXX XXXX."""
+    return f"{digits[:4]} {digits[4:8]} {digits[8:]}"
+
+
+def _normalize_aadhaar(value: Any) -> Any:
+    """Format a valid Aadhaar number with spaces."""
+    aadhaar = str(value).translate(_STRIP_SEPARATORS)
+    if _AADHAAR_RE.fullmatch(aadhaar):
+        return _format_aadhaar(aadhaar)
+    return value
+
+
+def _normalize_pan(value: Any) -> str:
+    """Uppercase a PAN number."""
+    return str(value).strip().upper()
+
+
+def _normalize_uan(value: Any) -> Any:
+    """Strip separators from a numeric UAN."""
+    uan = str(value).translate(_STRIP_SEPARATORS)
+    return uan if uan.isdigit() else value
 
 
 class AadhaarCardTemplate(BaseTemplate):
@@ -10,85 +50,55 @@ class AadhaarCardTemplate(BaseTemplate):
     
     category = DocumentCategory.ID_DOCUMENT
     
+    _FIELDS = (
+        FULL_NAME_FIELD,
+        FieldDefinition(
+            name="aadhaar_number",
+            display_name="Aadhaar Number",
+            field_type="string",
+            required=True,
+            description="12-digit Aadhaar number (XXXX XXXX XXXX)",
+        ),
+        DOB_FIELD,
+        GENDER_FIELD,
+        ADDRESS_FIELD,
+        FieldDefinition(
+            name="pincode",
+            display_name="PIN Code",
+            field_type="string",
+            required=False,
+        ),
+        FieldDefinition(
+            name="vid",
+            display_name="Virtual ID (VID)",
+            field_type="string",
+            required=False,
+        ),
+    )
+    
     @property
-    def field_definitions(self) -> list[FieldDefinition]:
-        return [
-            FieldDefinition(
-                name="full_name",
-                display_name="Full Name",
-                field_type="string",
-                required=True,
-            ),
-            FieldDefinition(
-                name="aadhaar_number",
-                display_name="Aadhaar Number",
-                field_type="string",
-                required=True,
-                description="12-digit Aadhaar number (XXXX XXXX XXXX)",
-            ),
-            FieldDefinition(
-                name="date_of_birth",
-                display_name="Date of Birth",
-                field_type="date",
-                required=True,
-            ),
-            FieldDefinition(
-                name="gender",
-                display_name="Gender",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="address",
-                display_name="Address",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="pincode",
-                display_name="PIN Code",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="vid",
-                display_name="Virtual ID (VID)",
-                field_type="string",
-                required=False,
-            ),
-        ]
+    def field_definitions(self) -> tuple[FieldDefinition, ...]:
+        return self._FIELDS
+    
+    _KEYWORDS = (
+        "aadhaar",
+        "uidai",
+        "unique identification",
+        "भारत सरकार",
+        "government of india",
+        "enrolment",
+        "vid",
+        "आधार",
+    )
     
     @property
-    def classification_keywords(self) -> list[str]:
-        return [
-            "aadhaar",
-            "uidai",
-            "unique identification",
-            "भारत सरकार",
-            "government of india",
-            "enrolment",
-            "vid",
-            "आधार",
-        ]
+    def classification_keywords(self) -> tuple[str, ...]:
+        return self._KEYWORDS
     
-    def post_process(self, fields: dict[str, Any]) -> dict[str, Any]:
-        processed = fields.copy()
-        
-        # Format Aadhaar number with spaces
-        if "aadhaar_number" in processed and processed["aadhaar_number"]:
-            aadhaar = str(processed["aadhaar_number"]).replace(" ", "").replace("-", "")
-            if len(aadhaar) == 12 and aadhaar.isdigit():
-                processed["aadhaar_number"] = f"{aadhaar[:4]} {aadhaar[4:8]} {aadhaar[8:]}"
-        
-        # Normalize gender
-        if "gender" in processed and processed["gender"]:
-            gender = str(processed["gender"]).upper().strip()
-            if gender in ("M", "MALE", "पुरुष"):
-                processed["gender"] = "Male"
-            elif gender in ("F", "FEMALE", "महिला"):
-                processed["gender"] = "Female"
-        
-        return processed
+    _NORMALIZERS = {
+        "aadhaar_number": _normalize_aadhaar,
+        "gender": normalize_gender,
+    }
 
 
 class PANCardTemplate(BaseTemplate):
@@ -96,62 +106,51 @@ class PANCardTemplate(BaseTemplate):
     
     category = DocumentCategory.ID_DOCUMENT
     
+    _FIELDS = (
+        FULL_NAME_FIELD,
+        FieldDefinition(
+            name="pan_number",
+            display_name="PAN Number",
+            field_type="string",
+            required=True,
+            description="10-character PAN (e.g., ABCDE1234F)",
+        ),
+        FieldDefinition(
+            name="fathers_name",
+            display_name="Father's Name",
+            field_type="string",
+            required=False,
+        ),
+        DOB_FIELD,
+        FieldDefinition(
+            name="signature_name",
+            display_name="Name on Signature",
+            field_type="string",
+            required=False,
+        ),
+    )
+    
     @property
-    def field_definitions(self) -> list[FieldDefinition]:
-        return [
-            FieldDefinition(
-                name="full_name",
-                display_name="Full Name",
-                field_type="string",
-                required=True,
-            ),
-            FieldDefinition(
-                name="pan_number",
-                display_name="PAN Number",
-                field_type="string",
-                required=True,
-                description="10-character PAN (e.g., ABCDE1234F)",
-            ),
-            FieldDefinition(
-                name="fathers_name",
-                display_name="Father's Name",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="date_of_birth",
-                display_name="Date of Birth",
-                field_type="date",
-                required=True,
-            ),
-            FieldDefinition(
-                name="signature_name",
-                display_name="Name on Signature",
-                field_type="string",
-                required=False,
-            ),
-        ]
+    def field_definitions(self) -> tuple[FieldDefinition, ...]:
+        return self._FIELDS
+    
+    _KEYWORDS = (
+        "permanent account number",
+        "pan",
+        "income tax",
+        "आयकर विभाग",
+        "govt. of india",
+        "NSDL",
+        "UTI",
+    )
     
     @property
-    def classification_keywords(self) -> list[str]:
-        return [
-            "permanent account number",
-            "pan",
-            "income tax",
-            "आयकर विभाग",
-            "govt. of india",
-            "NSDL",
-            "UTI",
-        ]
+    def classification_keywords(self) -> tuple[str, ...]:
+        return self._KEYWORDS
     
-    def post_process(self, fields: dict[str, Any]) -> dict[str, Any]:
-        processed = fields.copy()
-        
-        # Uppercase PAN number
-        if "pan_number" in processed and processed["pan_number"]:
-            processed["pan_number"] = str(processed["pan_number"]).upper().strip()
-        
-        return processed
+    _NORMALIZERS = {
+        "pan_number": _normalize_pan,
+    }
 
 
 class UANCardTemplate(BaseTemplate):
@@ -159,109 +158,83 @@ class UANCardTemplate(BaseTemplate):
     
     category = DocumentCategory.ID_DOCUMENT
     
+    _FIELDS = (
+        FieldDefinition(
+            name="member_name",
+            display_name="Member Name",
+            field_type="string",
+            required=True,
+            description="Name of the member/employee",
+        ),
+        FieldDefinition(
+            name="uan_number",
+            display_name="UAN Number",
+            field_type="string",
+            required=True,
+            description="12-digit Universal Account Number",
+        ),
+        DOB_FIELD,
+        GENDER_FIELD,
+        FATHERS_NAME_FIELD,
+        FieldDefinition(
+            name="aadhaar_verified",
+            display_name="Aadhaar Verified",
+            field_type="string",
+            required=False,
+        ),
+        FieldDefinition(
+            name="pan_verified",
+            display_name="PAN Verified", 
+            field_type="string",
+            required=False,
+        ),
+        FieldDefinition(
+            name="bank_verified",
+            display_name="Bank Verified",
+            field_type="string",
+            required=False,
+        ),
+        FieldDefinition(
+            name="employer_name",
+            display_name="Employer Name",
+            field_type="string",
+            required=False,
+        ),
+        FieldDefinition(
+            name="establishment_id",
+            display_name="Establishment ID",
+            field_type="string",
+            required=False,
+        ),
+        ADDRESS_FIELD,
+    )
+    
     @property
-    def field_definitions(self) -> list[FieldDefinition]:
-        return [
-            FieldDefinition(
-                name="member_name",
-                display_name="Member Name",
-                field_type="string",
-                required=True,
-                description="Name of the member/employee",
-            ),
-            FieldDefinition(
-                name="uan_number",
-                display_name="UAN Number",
-                field_type="string",
-                required=True,
-                description="12-digit Universal Account Number",
-            ),
-            FieldDefinition(
-                name="date_of_birth",
-                display_name="Date of Birth",
-                field_type="date",
-                required=True,
-            ),
-            FieldDefinition(
-                name="gender",
-                display_name="Gender",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="fathers_name",
-                display_name="Father's/Husband's Name",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="aadhaar_verified",
-                display_name="Aadhaar Verified",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="pan_verified",
-                display_name="PAN Verified", 
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="bank_verified",
-                display_name="Bank Verified",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="employer_name",
-                display_name="Employer Name",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="establishment_id",
-                display_name="Establishment ID",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="address",
-                display_name="Address",
-                field_type="string",
-                required=False,
-            ),
-        ]
+    def field_definitions(self) -> tuple[FieldDefinition, ...]:
+        return self._FIELDS
+    
+    _KEYWORDS = (
+        "uan",
+        "universal account number",
+        "epfo",
+        "epf",
+        "provident fund",
+        "shram",
+        "e-shram",
+        "ministry of labour",
+        "श्रम कार्ड",
+        "member id",
+        "unorganised worker",
+    )
     
     @property
-    def classification_keywords(self) -> list[str]:
-        return [
-            "uan",
-            "universal account number",
-            "epfo",
-            "epf",
-            "provident fund",
-            "shram",
-            "e-shram",
-            "ministry of labour",
-            "श्रम कार्ड",
-            "member id",
-            "unorganised worker",
-        ]
+    def classification_keywords(self) -> tuple[str, ...]:
+        return self._KEYWORDS
     
-    def post_process(self, fields: dict[str, Any]) -> dict[str, Any]:
-        processed = fields.copy()
-        
-        # Normalize name
-        if "member_name" in processed and processed["member_name"]:
-            processed["member_name"] = processed["member_name"].strip().title()
-        
-        # Format UAN
-        if "uan_number" in processed and processed["uan_number"]:
-            uan = str(processed["uan_number"]).replace(" ", "").replace("-", "")
-            if uan.isdigit():
-                processed["uan_number"] = uan
-        
-        return processed
+    _NORMALIZERS = {
+        "member_name": strip_title,
+        "uan_number": _normalize_uan,
+    }
 
 
 class VoterIDTemplate(BaseTemplate):
@@ -269,78 +242,62 @@ class VoterIDTemplate(BaseTemplate):
     
     category = DocumentCategory.ID_DOCUMENT
     
+    _FIELDS = (
+        FieldDefinition(
+            name="elector_name",
+            display_name="Elector's Name",
+            field_type="string",
+            required=True,
+        ),
+        FieldDefinition(
+            name="epic_number",
+            display_name="EPIC Number",
+            field_type="string",
+            required=True,
+            description="Voter ID number",
+        ),
+        FATHERS_NAME_FIELD,
+        OPTIONAL_DOB_FIELD,
+        FieldDefinition(
+            name="age",
+            display_name="Age",
+            field_type="number",
+            required=False,
+        ),
+        GENDER_FIELD,
+        ADDRESS_FIELD,
+        FieldDefinition(
+            name="polling_station",
+            display_name="Polling Station",
+            field_type="string",
+            required=False,
+        ),
+        FieldDefinition(
+            name="constituency",
+            display_name="Assembly Constituency",
+            field_type="string",
+            required=False,
+        ),
+    )
+    
     @property
-    def field_definitions(self) -> list[FieldDefinition]:
-        return [
-            FieldDefinition(
-                name="elector_name",
-                display_name="Elector's Name",
-                field_type="string",
-                required=True,
-            ),
-            FieldDefinition(
-                name="epic_number",
-                display_name="EPIC Number",
-                field_type="string",
-                required=True,
-                description="Voter ID number",
-            ),
-            FieldDefinition(
-                name="fathers_name",
-                display_name="Father's/Husband's Name",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="date_of_birth",
-                display_name="Date of Birth",
-                field_type="date",
-                required=False,
-            ),
-            FieldDefinition(
-                name="age",
-                display_name="Age",
-                field_type="number",
-                required=False,
-            ),
-            FieldDefinition(
-                name="gender",
-                display_name="Gender",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="address",
-                display_name="Address",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="polling_station",
-                display_name="Polling Station",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="constituency",
-                display_name="Assembly Constituency",
-                field_type="string",
-                required=False,
-            ),
-        ]
+    def field_definitions(self) -> tuple[FieldDefinition, ...]:
+        return self._FIELDS
+    
+    _KEYWORDS = (
+        "voter",
+        "epic",
+        "election commission",
+        "elector",
+        "polling",
+        "निर्वाचन",
+        "मतदाता",
+        "assembly constituency",
+    )
     
     @property
-    def classification_keywords(self) -> list[str]:
-        return [
-            "voter",
-            "epic",
-            "election commission",
-            "elector",
-            "polling",
-            "निर्वाचन",
-            "मतदाता",
-            "assembly constituency",
-        ]
+    def classification_keywords(self) -> tuple[str, ...]:
+        return self._KEYWORDS
 
 
 class DrivingLicenseTemplate(BaseTemplate):
@@ -348,83 +305,72 @@ class DrivingLicenseTemplate(BaseTemplate):
     
     category = DocumentCategory.ID_DOCUMENT
     
+    _FIELDS = (
+        FieldDefinition(
+            name="holder_name",
+            display_name="Name of Holder",
+            field_type="string",
+            required=True,
+        ),
+        FieldDefinition(
+            name="license_number",
+            display_name="License Number",
+            field_type="string",
+            required=True,
+        ),
+        DOB_FIELD,
+        FieldDefinition(
+            name="blood_group",
+            display_name="Blood Group",
+            field_type="string",
+            required=False,
+        ),
+        FATHERS_NAME_FIELD,
+        ADDRESS_FIELD,
+        FieldDefinition(
+            name="issue_date",
+            display_name="Date of Issue",
+            field_type="date",
+            required=False,
+        ),
+        FieldDefinition(
+            name="valid_till",
+            display_name="Valid Till",
+            field_type="date",
+            required=False,
+        ),
+        FieldDefinition(
+            name="vehicle_classes",
+            display_name="Vehicle Class(es)",
+            field_type="string",
+            required=False,
+            description="e.g., LMV, MCWG",
+        ),
+        FieldDefinition(
+            name="issuing_authority",
+            display_name="Issuing Authority (RTO)",
+            field_type="string",
+            required=False,
+        ),
+    )
+    
     @property
-    def field_definitions(self) -> list[FieldDefinition]:
-        return [
-            FieldDefinition(
-                name="holder_name",
-                display_name="Name of Holder",
-                field_type="string",
-                required=True,
-            ),
-            FieldDefinition(
-                name="license_number",
-                display_name="License Number",
-                field_type="string",
-                required=True,
-            ),
-            FieldDefinition(
-                name="date_of_birth",
-                display_name="Date of Birth",
-                field_type="date",
-                required=True,
-            ),
-            FieldDefinition(
-                name="blood_group",
-                display_name="Blood Group",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="fathers_name",
-                display_name="Father's/Husband's Name",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="address",
-                display_name="Address",
-                field_type="string",
-                required=False,
-            ),
-            FieldDefinition(
-                name="issue_date",
-                display_name="Date of Issue",
-                field_type="date",
-                required=False,
-            ),
-            FieldDefinition(
-                name="valid_till",
-                display_name="Valid Till",
-                field_type="date",
-                required=False,
-            ),
-            FieldDefinition(
-                name="vehicle_classes",
-                display_name="Vehicle Class(es)",
-                field_type="string",
-                required=False,
-                description="e.g., LMV, MCWG",
-            ),
-            FieldDefinition(
-                name="issuing_authority",
-                display_name="Issuing Authority (RTO)",
-                field_type="string",
-                required=False,
-            ),
-        ]
+    def field_definitions(self) -> tuple[FieldDefinition, ...]:
+        return self._FIELDS
+    
+    _KEYWORDS = (
+        "driving",
+        "license",
+        "licence",
+        "motor vehicle",
+        "rto",
+        "transport",
+        "lmv",
+        "mcwg",
+        "valid till",
+        "blood group",
+    )
     
     @property
-    def classification_keywords(self) -> list[str]:
-        return [
-            "driving",
-            "license",
-            "licence",
-            "motor vehicle",
-            "rto",
-            "transport",
-            "lmv",
-            "mcwg",
-            "valid till",
-            "blood group",
-        ]
+    def classification_keywords(self) -> tuple[str, ...]:
+        return self._KEYWORDS
@@ -1,8 +1,15 @@
 import streamlit as st
 import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+import hashlib
+import io
 from pathlib import Path
 import sys
 import os
+import time
+
+from PIL import Image, ImageOps
 
 # Add project root to path to ensure imports work
 # distinct from where the script is run
@@ -11,7 +18,8 @@ project_root = current_dir.parent
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
-from src.processor import DocumentProcessor
+from src.config import get_settings
+from src.processor import DocumentProcessor, ProcessingResult
 from src.output.schemas import DocumentTypeEnum
 
 st.set_page_config(
@@ -36,15 +44,243 @@ st.markdown("""
 def get_processor():
     return DocumentProcessor()
 
+@st.cache_resource
+def get_executor():
+    # Extractions run here so the script thread stays free to update the
+    # page (and to be interrupted by a rerun) while OCR/LLM work is going on.
+    # Shared by all sessions and, like the API's batch limit, sized by CPU:
+    # every extraction uses the one processor, whose OCR runs one document
+    # at a time while loading, enhancement and LLM calls overlap
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+@st.cache_resource
+def warm_up():
+    # Build the processor in the background once per server process, as the
+    # app first loads, so the first extraction doesn't wait for it
+    return get_executor().submit(get_processor)
+
+class ExtractionProgress:
+    # Latest stage reported by an extraction running on the pool; the
+    # script thread reads it, since only it can update the page
+    def __init__(self):
+        self.message = "Queued"
+        self.fraction = 0.0
+
+    def __call__(self, message, fraction):
+        self.message = message
+        self.fraction = fraction
+
+class UIExtractionError(Exception):
+    # Raised so st.cache_data doesn't cache failed results
+    def __init__(self, result: ProcessingResult):
+        super().__init__(result.response.errors)
+        self.result = result
+
+@st.cache_data(show_spinner=False, max_entries=64, ttl=3600)
+def extract(content_digest, filename, document_type_hint, _content, _progress):
+    # Keyed on the content digest; _content itself is left out of the key
+    # so Streamlit doesn't hash the whole file again on every call
+    result = get_processor().process_file(
+        content=_content,
+        filename=filename,
+        document_type_hint=document_type_hint,
+        progress=_progress
+    )
+    if not result.success:
+        raise UIExtractionError(result)
+    return result
+
+def run_extraction(content, digest, filename, document_type_hint, progress):
+    try:
+        return extract(digest, filename, document_type_hint, content, progress)
+    except UIExtractionError as e:
+        return e.result
+
+# Choices for the sidebar's document type hint
+DOC_TYPE_OPTIONS = ("Auto-detect", *(t.value for t in DocumentTypeEnum))
+
+# Longest edge of the image preview; the full image is only needed for OCR
+PREVIEW_MAX_DIMENSION = 1200
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def preview_image(content_digest, _content):
+    image = Image.open(io.BytesIO(_content))
+    # Let libjpeg decode large JPEGs at a reduced scale
+    image.draft("RGB", (PREVIEW_MAX_DIMENSION, PREVIEW_MAX_DIMENSION))
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((PREVIEW_MAX_DIMENSION, PREVIEW_MAX_DIMENSION))
+    return image
+
+def preview_pane(documents):
+    st.subheader("Document Preview")
+    for uploaded_file, content, digest in documents:
+        if len(documents) > 1:
+            st.caption(uploaded_file.name)
+        if uploaded_file.type.startswith('image'):
+            st.image(preview_image(digest, content), use_container_width=True)
+        elif uploaded_file.type == 'application/pdf':
+            st.info("PDF Preview not supported natively in this view, but file is loaded.")
+        else:
+            st.info(f"Preview not available for {uploaded_file.type}")
+
+@lru_cache(maxsize=256)
+def field_label(field):
+    # Field names come from a small fixed set across all templates
+    return field.replace('_', ' ').title()
+
+def show_result(result):
+    if result.success:
+        # Display Overall Confidence
+        confidence = result.response.overall_confidence
+        metric_color = "normal"
+        if confidence > 0.8:
+            metric_color = "normal" 
+        elif confidence > 0.5:
+            metric_color = "off"
+        else:
+            metric_color = "inverse"
+            
+        st.metric(
+            label="Overall Confidence", 
+            value=f"{confidence:.2%}",
+            delta=None
+        )
+        
+        # Display Fields
+        st.markdown("### Extracted Fields")
+        data = result.response.extracted_data
+        confidences = result.response.field_confidences
+        
+        # One markdown element for all fields instead of one each
+        rows = []
+        for field, value in data.items():
+            field_conf = confidences.get(field, 0.0)
+            color = "green" if field_conf > 0.8 else "orange" if field_conf > 0.5 else "red"
+            
+            rows.append(
+                f"**{field_label(field)}**: {value} "
+                f"<span style='color:{color}; font-size:0.8em'>({field_conf:.0%})</span>"
+            )
+        st.markdown("\n\n".join(rows), unsafe_allow_html=True)
+            
+        # JSON Response expander
+        with st.expander("View Raw JSON Response"):
+            # Serialized by pydantic-core; st.json passes JSON strings through as-is
+            st.json(result.response.model_dump_json())
+            
+    else:
+        st.error("Processing failed")
+        if result.response.errors:
+            st.error("\n\n".join(
+                f"{error.code}: {error.message}"
+                for error in result.response.errors
+            ))
+
+# A fragment, so clicking "Extract Data" reruns just this pane instead of the
+# whole script (sidebar, uploader, hashing and preview)
+@st.fragment
+def extraction_pane(documents, document_type_hint):
+    st.subheader("Extraction")
+    # Results shown so far this session, so reruns (other widgets, the
+    # fragment itself) redraw them instead of dropping or recomputing them
+    keys = [
+        (digest, uploaded_file.name, document_type_hint)
+        for uploaded_file, _, digest in documents
+    ]
+    shown = st.session_state.get("results", {})
+    results = st.session_state["results"] = {key: shown[key] for key in keys if key in shown}
+    
+    # One slot per file, in upload order
+    slots = []
+    clicked = st.button("Extract Data", type="primary", use_container_width=True)
+    for key, (uploaded_file, _, _) in zip(keys, documents):
+        slots.append(st.container())
+        if key in results and not clicked:
+            with slots[-1]:
+                if len(documents) > 1:
+                    st.markdown(f"#### {uploaded_file.name}")
+                show_result(results[key])
+    
+    if clicked:
+        many = len(documents) > 1
+        label = "Processing documents..." if many else "Processing document..."
+        with st.status(label, expanded=True) as status:
+            # Process files concurrently, up to the executor's worker count;
+            # results are cached, so extracting a file again returns at once.
+            # A click while earlier extractions are still running (which
+            # interrupts the run that was polling them) picks those up
+            # rather than submitting the same files again
+            executor = get_executor()
+            running = st.session_state.setdefault("running", {})
+            futures = {}
+            progresses = []
+            for i, (key, (uploaded_file, content, digest)) in enumerate(zip(keys, documents)):
+                future, progress = running.get(key, (None, None))
+                if future is None or future.done():
+                    progress = ExtractionProgress()
+                    future = executor.submit(
+                        run_extraction,
+                        content,
+                        digest,
+                        uploaded_file.name,
+                        document_type_hint,
+                        progress
+                    )
+                    running[key] = future, progress
+                futures[future] = i
+                progresses.append(progress)
+            
+            # Show each file's stage while polling, and fill its slot as it
+            # finishes
+            bar = st.progress(0.0)
+            stages = st.empty()
+            start = time.monotonic()
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.5)
+                for future in done:
+                    i = futures[future]
+                    running.pop(keys[i], None)
+                    with slots[i]:
+                        if many:
+                            st.markdown(f"#### {documents[i][0].name}")
+                        try:
+                            results[keys[i]] = future.result()
+                            show_result(results[keys[i]])
+                        except Exception as e:
+                            st.error(f"An error occurred: {str(e)}")
+                            import traceback
+                            st.code(traceback.format_exc())
+                
+                finished = len(futures) - len(pending)
+                running_fraction = sum(progresses[futures[f]].fraction for f in pending)
+                bar.progress((finished + running_fraction) / len(futures))
+                stages.caption("  \n".join(
+                    f"{documents[futures[f]][0].name}: {progresses[futures[f]].message}" if many
+                    else progresses[futures[f]].message
+                    for f in sorted(pending, key=futures.get)
+                ))
+                status.update(label=(
+                    f"Processed {finished} of {len(futures)} documents" if many else label
+                ) + f" ({time.monotonic() - start:.0f}s)")
+            
+            noun = "documents" if many else "document"
+            status.update(
+                label=f"Processed {noun} in {time.monotonic() - start:.0f}s",
+                state="complete",
+                expanded=False
+            )
+
 def main():
+    warm_up()
     st.title("📄 Document Extractor")
-    st.markdown("Upload a document to extract structured data.")
+    st.markdown("Upload documents to extract structured data.")
 
     # Sidebar configuration
     st.sidebar.header("Configuration")
     doc_type = st.sidebar.selectbox(
         "Document Type Hint (Optional)",
-        options=["Auto-detect"] + [t.value for t in DocumentTypeEnum],
+        options=DOC_TYPE_OPTIONS,
         index=0
     )
 
@@ -53,84 +289,36 @@ def main():
         document_type_hint = DocumentTypeEnum(doc_type)
 
     # File uploader
-    uploaded_file = st.file_uploader(
-        "Choose a file", 
-        type=["pdf", "jpg", "jpeg", "png", "docx"]
+    settings = get_settings()
+    uploaded_files = st.file_uploader(
+        "Choose files", 
+        type=["pdf", "jpg", "jpeg", "png", "docx"],
+        accept_multiple_files=True,
+        help=f"Max {settings.max_file_size_mb} MB per file"
     )
 
-    if uploaded_file:
+    documents = []
+    for uploaded_file in uploaded_files:
+        # Same limit as the API; reject before reading or processing the file
+        if uploaded_file.size > settings.max_file_size_bytes:
+            st.error(
+                f"{uploaded_file.name} exceeds maximum size of {settings.max_file_size_mb}MB"
+            )
+            continue
+        
+        # getvalue() hands back the upload's buffer without copying it
+        content = uploaded_file.getvalue()
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        documents.append((uploaded_file, content, digest))
+
+    if documents:
         col1, col2 = st.columns([1, 1])
         
         with col1:
-            st.subheader("Document Preview")
-            if uploaded_file.type.startswith('image'):
-                st.image(uploaded_file, use_container_width=True)
-            elif uploaded_file.type == 'application/pdf':
-                st.info("PDF Preview not supported natively in this view, but file is loaded.")
-            else:
-                st.info(f"Preview not available for {uploaded_file.type}")
+            preview_pane(documents)
 
         with col2:
-            st.subheader("Extraction")
-            if st.button("Extract Data", type="primary", use_container_width=True):
-                with st.spinner("Processing document..."):
-                    try:
-                        processor = get_processor()
-                        
-                        # Process file
-                        content = uploaded_file.getvalue()
-                        result = processor.process_file(
-                            content=content,
-                            filename=uploaded_file.name,
-                            document_type_hint=document_type_hint
-                        )
-                        
-                        if result.success:
-                            # Display Overall Confidence
-                            confidence = result.response.overall_confidence
-                            metric_color = "normal"
-                            if confidence > 0.8:
-                                metric_color = "normal" 
-                            elif confidence > 0.5:
-                                metric_color = "off"
-                            else:
-                                metric_color = "inverse"
-                                
-                            st.metric(
-                                label="Overall Confidence", 
-                                value=f"{confidence:.2%}",
-                                delta=None
-                            )
-                            
-                            # Display Fields
-                            st.markdown("### Extracted Fields")
-                            data = result.response.extracted_data
-                            confidences = result.response.field_confidences
-                            
-                            for field, value in data.items():
-                                field_conf = confidences.get(field, 0.0)
-                                color = "green" if field_conf > 0.8 else "orange" if field_conf > 0.5 else "red"
-                                
-                                st.markdown(
-                                    f"**{field.replace('_', ' ').title()}**: {value} "
-                                    f"<span style='color:{color}; font-size:0.8em'>({field_conf:.0%})</span>",
-                                    unsafe_allow_html=True
-                                )
-                                
-                            # JSON Response expander
-                            with st.expander("View Raw JSON Response"):
-                                st.json(result.response.model_dump())
-                                
-                        else:
-                            st.error("Processing failed")
-                            if result.response.errors:
-                                for error in result.response.errors:
-                                    st.error(f"{error.code}: {error.message}")
-                                    
-                    except Exception as e:
-                        st.error(f"An error occurred: {str(e)}")
-                        import traceback
-                        st.code(traceback.format_exc())
+            extraction_pane(documents, document_type_hint)
 
 if __name__ == "__main__":
     main()